@@ -26,9 +26,23 @@ from websockets.exceptions import ConnectionClosed
 
 from config import config
 
+try:
+    import orjson  # C JSON parser for REST responses and stream messages
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Order types that rest at a limit price / that wait for a trigger price
+_LIMIT_ORDER_TYPES = frozenset(("LIMIT", "STOP", "TAKE_PROFIT"))
+_CONDITIONAL_ORDER_TYPES = frozenset(("STOP", "STOP_MARKET", "TAKE_PROFIT", "TAKE_PROFIT_MARKET"))
+
+# How many recently closed order IDs are remembered, so a REST response
+# that arrives after the stream's FILLED/CANCELED can't re-add the order
+_CLOSED_ORDER_IDS_MAX = 1024
+
 
 class AsterAPIError(Exception):
     """
@@ -72,6 +86,13 @@ class AsterClient:
     authenticated endpoints. Signature is computed over:
         signature = HMAC-SHA256(secret, query_string + request_body)
     """
+
+    # Exchange limit for POST /fapi/v1/batchOrders
+    MAX_BATCH_ORDERS = 5
+    # Exchange limit for DELETE /fapi/v1/batchOrders
+    MAX_BATCH_CANCELS = 10
+    # Seconds a klines response is shared between callers
+    KLINES_CACHE_TTL = 5.0
     
     def __init__(
         self,
@@ -93,9 +114,25 @@ class AsterClient:
         self.api_secret = api_secret or config.api.API_SECRET
         self.base_url = base_url or config.api.BASE_URL
         self.ws_url = ws_url or config.api.WS_URL
+
+        # HMAC keyed once with the secret; each signature works on a copy
+        self._hmac = hmac.new(self.api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        # Server minus local clock in ms, set by sync_server_time()
+        self._time_offset_ms = 0
         
         self._session: aiohttp.ClientSession | None = None
         self._ws_connection: websockets.WebSocketClientProtocol | None = None
+
+        # WebSocket connection options. A deeper receive queue absorbs fill
+        # bursts without back-pressuring the server (at the cost of buffering
+        # up to max_queue frames in memory); permessage-deflate is disabled
+        # since the small JSON frames don't repay per-frame decompression.
+        self.ws_connect_kwargs: dict[str, Any] = {
+            "max_queue": 1024,
+            "compression": None,
+            "ping_interval": 20,
+            "ping_timeout": 60,
+        }
         
         # Rate limit handling with exponential backoff
         self._backoff_base = 1.0  # Base delay in seconds
@@ -107,10 +144,21 @@ class AsterClient:
         self._request_count = 0
         self._error_count = 0
 
+        # Positions and open orders kept current by the user data stream
+        # (REST-format rows, seeded on connect; only valid while _stream_state_live)
+        self._stream_positions: dict[str, dict[str, dict[str, Any]]] = {}  # symbol -> positionSide -> row
+        self._stream_open_orders: dict[int, dict[str, Any]] = {}
+        # Order IDs the stream has closed, oldest first (bounded by _CLOSED_ORDER_IDS_MAX)
+        self._stream_closed_ids: dict[int, None] = {}
+        self._stream_state_live = False
+
         # Exchange info cache for precision rounding
         self._symbol_precision_cache: dict[str, dict] = {}
         self._precision_cache_time: float = 0
         self._precision_cache_ttl: float = 3600  # 1 hour TTL
+
+        # Recent klines per (symbol, interval): (monotonic fetch time, rows)
+        self._klines_cache: dict[tuple[str, str], tuple[float, list[list]]] = {}
     
     async def __aenter__(self) -> "AsterClient":
         """Async context manager entry - creates HTTP session."""
@@ -125,7 +173,14 @@ class AsterClient:
         """Lazily create or return existing HTTP session."""
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=config.api.REQUEST_TIMEOUT)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Keep-alive pool: idle connections stay open between calls
+            # (the REST API is HTTP/1.1, so reuse is per connection)
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
     
     async def close(self) -> None:
@@ -161,18 +216,14 @@ class AsterClient:
         # Create sorted query string for consistent signing
         query_string = urlencode(sorted(params.items()))
         
-        # Compute HMAC-SHA256
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
+        # Compute HMAC-SHA256 from the pre-keyed state
+        mac = self._hmac.copy()
+        mac.update(query_string.encode("utf-8"))
+        return mac.hexdigest()
     
     def _get_timestamp(self) -> int:
-        """Get current timestamp in milliseconds for API requests."""
-        return int(time.time() * 1000)
+        """Get current timestamp in milliseconds for API requests (server-aligned)."""
+        return int(time.time() * 1000) + self._time_offset_ms
     
     def _add_auth_params(self, params: dict[str, Any]) -> dict[str, Any]:
         """
@@ -260,8 +311,9 @@ class AsterClient:
                 self._request_count += 1
                 
                 # Log request (mask sensitive data)
-                safe_params = {k: v for k, v in params.items() if k != "signature"}
-                logger.debug(f"Request: {method} {endpoint} params={safe_params}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    safe_params = {k: v for k, v in params.items() if k != "signature"}
+                    logger.debug("Request: %s %s params=%s", method, endpoint, safe_params)
                 
                 async with session.request(
                     method,
@@ -291,7 +343,7 @@ class AsterClient:
                     
                     # Parse JSON response
                     try:
-                        data = json.loads(response_text) if response_text else {}
+                        data = _json_loads(response_text) if response_text else {}
                     except json.JSONDecodeError:
                         data = {"raw_response": response_text}
                     
@@ -303,7 +355,7 @@ class AsterClient:
                         logger.error(f"API Error: {response.status} - {error_msg}")
                         raise AsterAPIError(response.status, error_code, error_msg)
                     
-                    logger.debug(f"Response: {response.status} - {data}")
+                    logger.debug("Response: %s - %s", response.status, data)
                     return data
                     
             except aiohttp.ClientError as e:
@@ -379,6 +431,10 @@ class AsterClient:
         """
         Get candlestick/kline data.
 
+        Responses are reused for KLINES_CACHE_TTL seconds by any caller
+        asking for the same symbol and interval with an equal or smaller
+        limit, so bursts of fills and re-grids share one request.
+
         Args:
             symbol: Trading pair
             interval: Kline interval (1m, 5m, 15m, 1h, 4h, 1d, etc.)
@@ -388,11 +444,23 @@ class AsterClient:
             List of klines: [open_time, open, high, low, close, volume, ...]
         """
         symbol = symbol or config.trading.SYMBOL
-        return await self._request(
+        key = (symbol, interval)
+        cached = self._klines_cache.get(key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] <= self.KLINES_CACHE_TTL
+            and len(cached[1]) >= limit
+        ):
+            return cached[1][-limit:]
+
+        klines = await self._request(
             "GET",
             "/fapi/v1/klines",
             {"symbol": symbol, "interval": interval, "limit": limit}
         )
+        if isinstance(klines, list):
+            self._klines_cache[key] = (time.monotonic(), klines)
+        return klines
 
     async def get_funding_rate(self, symbol: str | None = None) -> dict[str, Any]:
         """
@@ -630,6 +698,7 @@ class AsterClient:
         reduce_only: bool = False,
         position_side: Literal["LONG", "SHORT", "BOTH"] = "BOTH",
         client_order_id: str | None = None,
+        stop_price: Decimal | None = None,
     ) -> dict[str, Any]:
         """
         Place a new order.
@@ -655,10 +724,84 @@ class AsterClient:
             reduce_only: Only reduce position (no new entry)
             position_side: Position direction (for hedge mode)
             client_order_id: Custom order ID for tracking
+            stop_price: Trigger price (required for STOP/TAKE_PROFIT types)
             
         Returns:
             Order response including orderId, status, etc.
         """
+        params = await self._build_order_params(
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only,
+            position_side=position_side,
+            client_order_id=client_order_id,
+            stop_price=stop_price,
+        )
+
+        if config.DRY_RUN:
+            logger.info(
+                f"[DRY RUN] place_order: {side} {order_type} {params['quantity']} @ {params.get('price')}"
+            )
+            return self._dry_run_order(params)
+        
+        response = await self._request("POST", "/fapi/v1/order", params, signed=True)
+        self._track_order_response(response)
+        return response
+
+    async def place_batch_orders(self, orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Place up to MAX_BATCH_ORDERS orders in a single signed request.
+
+        Each entry takes the same keyword arguments as place_order. The
+        exchange answers per order, in request order: an entry is either
+        the order response or an error object with "code" and "msg".
+
+        Args:
+            orders: List of place_order keyword argument dicts
+
+        Returns:
+            List of per-order responses, aligned with `orders`
+        """
+        if not orders:
+            return []
+        if len(orders) > self.MAX_BATCH_ORDERS:
+            raise ValueError(f"At most {self.MAX_BATCH_ORDERS} orders per batch")
+
+        batch = [await self._build_order_params(**order) for order in orders]
+
+        if config.DRY_RUN:
+            logger.info(f"[DRY RUN] place_batch_orders: {len(batch)} orders")
+            return [self._dry_run_order(params) for params in batch]
+
+        response = await self._request(
+            "POST",
+            "/fapi/v1/batchOrders",
+            {"batchOrders": json.dumps(batch, separators=(",", ":"))},
+            signed=True,
+        )
+        responses = response if isinstance(response, list) else [response]
+        for entry in responses:
+            self._track_order_response(entry)
+        return responses
+
+    async def _build_order_params(
+        self,
+        symbol: str,
+        side: Literal["BUY", "SELL"],
+        order_type: str,
+        quantity: Decimal,
+        price: Decimal | None = None,
+        time_in_force: Literal["GTC", "IOC", "FOK"] = "GTC",
+        reduce_only: bool = False,
+        position_side: Literal["LONG", "SHORT", "BOTH"] = "BOTH",
+        client_order_id: str | None = None,
+        stop_price: Decimal | None = None,
+    ) -> dict[str, str]:
+        """Build exchange order parameters with quantity/price rounded to symbol precision."""
         # Get precision info and round values (prevents API rejections)
         precision_info = await self.get_symbol_precision(symbol)
         qty_precision = precision_info.get("quantityPrecision", 3)
@@ -685,34 +828,42 @@ class AsterClient:
             "positionSide": position_side,
         }
 
-        # Add price for limit orders
-        if order_type == "LIMIT":
+        # Add price for limit orders (conditional STOP/TAKE_PROFIT are limit orders too)
+        if order_type in _LIMIT_ORDER_TYPES:
             if rounded_price is None:
-                raise ValueError("Price is required for LIMIT orders")
+                raise ValueError(f"Price is required for {order_type} orders")
             params["price"] = str(rounded_price)
             params["timeInForce"] = time_in_force
 
+        # Add trigger price for conditional orders
+        if order_type in _CONDITIONAL_ORDER_TYPES:
+            if stop_price is None:
+                raise ValueError(f"Stop price is required for {order_type} orders")
+            params["stopPrice"] = str(
+                self._round_to_precision(Decimal(str(stop_price)), price_precision)
+            )
+
         if reduce_only:
             params["reduceOnly"] = "true"
 
         if client_order_id:
             params["newClientOrderId"] = client_order_id
 
-        if config.DRY_RUN:
-            logger.info(f"[DRY RUN] place_order: {side} {order_type} {rounded_qty} @ {rounded_price}")
-            return {
-                "orderId": int(time.time() * 1000),
-                "symbol": symbol,
-                "status": "NEW",
-                "clientOrderId": client_order_id or f"dry_{int(time.time())}",
-                "price": str(rounded_price) if rounded_price else "0",
-                "origQty": str(rounded_qty),
-                "executedQty": "0",
-                "side": side,
-                "type": order_type,
-            }
-        
-        return await self._request("POST", "/fapi/v1/order", params, signed=True)
+        return params
+
+    def _dry_run_order(self, params: dict[str, str]) -> dict[str, Any]:
+        """Mock order response for DRY_RUN mode."""
+        return {
+            "orderId": int(time.time() * 1000),
+            "symbol": params["symbol"],
+            "status": "NEW",
+            "clientOrderId": params.get("newClientOrderId") or f"dry_{int(time.time())}",
+            "price": params.get("price", "0"),
+            "origQty": params["quantity"],
+            "executedQty": "0",
+            "side": params["side"],
+            "type": params["type"],
+        }
     
     async def cancel_order(
         self,
@@ -744,8 +895,42 @@ class AsterClient:
             logger.info(f"[DRY RUN] cancel_order: {order_id or client_order_id}")
             return {"orderId": order_id, "status": "CANCELED"}
         
-        return await self._request("DELETE", "/fapi/v1/order", params, signed=True)
+        response = await self._request("DELETE", "/fapi/v1/order", params, signed=True)
+        self._track_order_response(response)
+        return response
     
+    async def cancel_batch_orders(self, symbol: str, order_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        Cancel up to MAX_BATCH_CANCELS orders in a single signed request.
+
+        Args:
+            symbol: Trading pair
+            order_ids: Exchange order IDs to cancel
+
+        Returns:
+            List of per-order responses, aligned with `order_ids`
+            (an entry is either the canceled order or an error with "code" and "msg")
+        """
+        if not order_ids:
+            return []
+        if len(order_ids) > self.MAX_BATCH_CANCELS:
+            raise ValueError(f"At most {self.MAX_BATCH_CANCELS} orders per batch cancel")
+
+        if config.DRY_RUN:
+            logger.info(f"[DRY RUN] cancel_batch_orders: {order_ids}")
+            return [{"orderId": order_id, "status": "CANCELED"} for order_id in order_ids]
+
+        response = await self._request(
+            "DELETE",
+            "/fapi/v1/batchOrders",
+            {"symbol": symbol, "orderIdList": json.dumps(order_ids, separators=(",", ":"))},
+            signed=True,
+        )
+        responses = response if isinstance(response, list) else [response]
+        for entry in responses:
+            self._track_order_response(entry)
+        return responses
+
     async def cancel_all_orders(self, symbol: str) -> dict[str, Any]:
         """
         Cancel all open orders for a symbol.
@@ -765,12 +950,18 @@ class AsterClient:
             logger.info(f"[DRY RUN] cancel_all_orders: {symbol}")
             return {"code": 200, "msg": "All orders canceled (dry run)"}
         
-        return await self._request(
+        response = await self._request(
             "DELETE", 
             "/fapi/v1/allOpenOrders", 
             {"symbol": symbol}, 
             signed=True
         )
+        # Don't wait for the stream's CANCELED events before callers re-read orders
+        self._stream_open_orders = {
+            order_id: order for order_id, order in self._stream_open_orders.items()
+            if order["symbol"] != symbol
+        }
+        return response
     
     # =========================================================================
     # LEVERAGE & MARGIN MANAGEMENT
@@ -902,20 +1093,32 @@ class AsterClient:
         keepalive_task = asyncio.create_task(keepalive())
         
         try:
-            async with websockets.connect(ws_url) as ws:
+            async with websockets.connect(ws_url, **self.ws_connect_kwargs) as ws:
                 self._ws_connection = ws
                 logger.info("User data stream connected")
+
+                # Clocks may have drifted while disconnected
+                await self.sync_server_time()
+
+                # Snapshot now; events queued since connecting are applied on top
+                await self._seed_stream_state()
                 
                 async for message in ws:
                     try:
-                        data = json.loads(message)
+                        data = _json_loads(message)
                         event_type = data.get("e")
                         
-                        if event_type == "ORDER_TRADE_UPDATE" and on_order_update:
-                            on_order_update(data.get("o", {}))
+                        if event_type == "ORDER_TRADE_UPDATE":
+                            order = data.get("o", {})
+                            self._apply_stream_order(order)
+                            if on_order_update:
+                                on_order_update(order)
                         
                         elif event_type == "ACCOUNT_UPDATE":
                             update_data = data.get("a", {})
+
+                            for position in update_data.get("P", ()):
+                                self._apply_stream_position(position)
                             
                             # Position updates
                             if on_position_update and "P" in update_data:
@@ -937,11 +1140,112 @@ class AsterClient:
         finally:
             keepalive_task.cancel()
             self._ws_connection = None
+            self._stream_state_live = False
+
+    async def _seed_stream_state(self) -> None:
+        """Load positions and open orders over REST for the user data stream to keep current."""
+        self._stream_state_live = False
+        try:
+            positions, open_orders = await asyncio.gather(
+                self.get_position_risk(), self.get_open_orders()
+            )
+        except Exception as e:
+            logger.warning(f"Could not snapshot positions/orders for the stream, using REST: {e}")
+            return
+
+        self._stream_positions = {}
+        for pos in positions:
+            self._stream_positions.setdefault(pos["symbol"], {})[pos.get("positionSide", "BOTH")] = {
+                "symbol": pos["symbol"],
+                "positionAmt": pos.get("positionAmt", "0"),
+                "entryPrice": pos.get("entryPrice", "0"),
+                "unRealizedProfit": pos.get("unRealizedProfit", "0"),
+                "positionSide": pos.get("positionSide", "BOTH"),
+            }
+        self._stream_open_orders = {order["orderId"]: order for order in open_orders}
+        self._stream_state_live = True
+
+    def _apply_stream_position(self, position: dict[str, Any]) -> None:
+        """Fold an ACCOUNT_UPDATE position entry into the streamed positions."""
+        symbol = position.get("s")
+        side = position.get("ps", "BOTH")
+        self._stream_positions.setdefault(symbol, {})[side] = {
+            "symbol": symbol,
+            "positionAmt": position.get("pa", "0"),
+            "entryPrice": position.get("ep", "0"),
+            "unRealizedProfit": position.get("up", "0"),
+            "positionSide": side,
+        }
+
+    def _apply_stream_order(self, order: dict[str, Any]) -> None:
+        """Fold an ORDER_TRADE_UPDATE into the streamed open orders."""
+        order_id = order.get("i")
+        if order.get("X") in ("NEW", "PARTIALLY_FILLED"):
+            self._stream_open_orders[order_id] = {
+                "symbol": order.get("s"),
+                "orderId": order_id,
+                "clientOrderId": order.get("c"),
+                "side": order.get("S"),
+                "type": order.get("o"),
+                "price": order.get("p", "0"),
+                "origQty": order.get("q", "0"),
+                "executedQty": order.get("z", "0"),
+                "status": order.get("X"),
+            }
+        else:
+            self._stream_open_orders.pop(order_id, None)
+            closed = self._stream_closed_ids
+            closed[order_id] = None
+            if len(closed) > _CLOSED_ORDER_IDS_MAX:
+                del closed[next(iter(closed))]
+
+    def _track_order_response(self, response: dict[str, Any]) -> None:
+        """
+        Apply a REST order/cancel response to the streamed open orders.
+
+        The stream reports the same change moments later; applying it now
+        means a read right after placing or cancelling already reflects it.
+        The stream can also get there first (e.g. a LIMIT that fills at
+        once), so a response for an order it already closed is ignored.
+        """
+        order_id = response.get("orderId")
+        if order_id is None or order_id in self._stream_closed_ids:
+            return
+        if response.get("status") in ("NEW", "PARTIALLY_FILLED"):
+            self._stream_open_orders[order_id] = response
+        else:
+            self._stream_open_orders.pop(order_id, None)
+
+    def get_streamed_positions(self, symbol: str) -> list[dict[str, Any]] | None:
+        """
+        Positions for a symbol as pushed over the user data stream.
+
+        Rows carry the get_position_risk keys symbol, positionAmt, entryPrice,
+        unRealizedProfit and positionSide.
+
+        Returns:
+            List of positions, or None while no stream is keeping them current
+        """
+        if not self._stream_state_live:
+            return None
+        return list(self._stream_positions.get(symbol, {}).values())
+
+    def get_streamed_open_orders(self, symbol: str) -> list[dict[str, Any]] | None:
+        """
+        Open orders for a symbol as pushed over the user data stream.
+
+        Returns:
+            List of orders in get_open_orders format, or None while no stream
+            is keeping them current
+        """
+        if not self._stream_state_live:
+            return None
+        return [order for order in self._stream_open_orders.values() if order["symbol"] == symbol]
     
     async def subscribe_market_data(
         self,
         symbol: str,
-        streams: list[Literal["trade", "markPrice", "depth", "kline"]],
+        streams: list[str],
         on_message: Callable[[str, dict], None],
     ) -> None:
         """
@@ -951,7 +1255,7 @@ class AsterClient:
         - trade: Real-time trades
         - markPrice: Mark price updates (every 3s or real-time)
         - depth: Order book updates
-        - kline: Candlestick updates
+        - kline_<interval>: Candlestick updates (e.g. kline_1h)
         
         Args:
             symbol: Trading pair (lowercase for stream name)
@@ -964,10 +1268,10 @@ class AsterClient:
         
         logger.info(f"Connecting to market data: {streams}")
         
-        async with websockets.connect(ws_url) as ws:
+        async with websockets.connect(ws_url, **self.ws_connect_kwargs) as ws:
             async for message in ws:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     stream = data.get("stream", "")
                     payload = data.get("data", {})
                     on_message(stream, payload)
@@ -1092,6 +1396,31 @@ class AsterClient:
         """
         response = await self._request("GET", "/fapi/v1/time")
         return response.get("serverTime", 0)
+
+    async def sync_server_time(self) -> int:
+        """
+        Align request timestamps with the server clock.
+
+        Measures the server/local offset once (against the midpoint of the
+        round-trip) so signed requests never need their own time lookup.
+        Called at startup and whenever the user data stream reconnects;
+        on failure the previous offset is kept.
+
+        Returns:
+            Offset in milliseconds applied to request timestamps
+        """
+        try:
+            sent = time.time() * 1000
+            server_time = await self.get_server_time()
+            received = time.time() * 1000
+        except Exception as e:
+            logger.warning(f"Server time sync failed, keeping offset {self._time_offset_ms}ms: {e}")
+            return self._time_offset_ms
+
+        if server_time:
+            self._time_offset_ms = int(server_time - (sent + received) / 2)
+            logger.debug("Server time offset: %sms", self._time_offset_ms)
+        return self._time_offset_ms
     
     def get_stats(self) -> dict[str, int]:
         """
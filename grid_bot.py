@@ -28,13 +28,20 @@ Example:
     If price bounces back, we capture the grid profit
 """
 import asyncio
+import heapq
+import itertools
 import logging
 import signal
 import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from decimal import Decimal, ROUND_DOWN, ROUND_UP
-from enum import Enum
+from datetime import datetime, timedelta
+from decimal import Decimal, ROUND_UP
+from enum import Enum, IntEnum
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import Callable
 
 from config import config
@@ -46,6 +53,11 @@ from strategy_manager import StrategyManager
 from indicator_analyzer import IndicatorAnalyzer, get_smart_tp, TrailingTPResult
 from trade_event_logger import trade_event_logger
 
+try:
+    import uvloop  # libuv-based event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
 # Configure logging with structured format
 logging.basicConfig(
     level=getattr(logging, config.log.LOG_LEVEL),
@@ -66,6 +78,133 @@ logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 logger = logging.getLogger("GridBot")
 
+# Local hour at which the daily Telegram report is sent
+DAILY_REPORT_HOUR = 8
+
+# Hourly Telegram summary period and daily PnL window (seconds)
+HOURLY_SUMMARY_SECONDS = 3600
+DAILY_RESET_SECONDS = 24 * 3600
+
+# Max age of the cached last price before falling back to a REST ticker
+PRICE_STALE_SECONDS = 90
+
+# Max age of a streamed price used to place or reprice orders (seconds)
+LIVE_PRICE_MAX_AGE = 2.0
+
+# How long a position-risk snapshot may be reused between fills (seconds)
+POSITION_CACHE_TTL = 0.5
+
+# 1h candles kept from the kline stream, and how long without an update
+# before the cache is considered dead and REST is used instead (seconds)
+KLINE_CACHE_SIZE = 200
+KLINE_STALE_SECONDS = 120
+
+# Startup cancel confirmation: open-orders poll period, and the pause after
+# the book clears so released margin shows up in the balance read (seconds)
+OPEN_ORDERS_POLL_SECONDS = 0.5
+MARGIN_SETTLE_SECONDS = 0.5
+
+# Max time without an account event before the circuit breaker re-reads
+# balance and positions over REST (seconds)
+ACCOUNT_STALE_SECONDS = 300
+
+# While the exchange shows no position the breaker inputs only move on a
+# fill, balance or position event, so a clean flat check is trusted this
+# long (seconds)
+CB_IDLE_SKIP_SECONDS = 900
+
+# Shared Decimal constants (Decimals are immutable, so one instance serves all uses)
+_D0 = Decimal("0")
+_D1 = Decimal("1")
+_D100 = Decimal("100")
+_D_PRICE_CEILING = Decimal("999999")  # Initial "lowest price seen" for SHORT tracking
+
+
+@lru_cache(maxsize=4096)
+def _D(value: str) -> Decimal:
+    """
+    Decimal from an exchange string field ("" counts as zero), cached.
+
+    Grid prices, fill quantities and position sizes repeat across events,
+    so most parses on the stream paths become a dict lookup. Only use it
+    for strings, and not for ever-changing values like unrealized PnL.
+    """
+    return Decimal(value or "0")
+
+
+# Quantization exponents for display formatting (built once, reused per message)
+_Q2 = Decimal(1).scaleb(-2)
+_Q4 = Decimal(1).scaleb(-4)
+
+
+def _fmt(value: Decimal, q: Decimal = _Q2) -> str:
+    """Format a Decimal for display with a pre-built quantization exponent."""
+    return format(value.quantize(q), "f")
+
+
+@lru_cache(maxsize=32)
+def _grid_prices(
+    lower: Decimal, grid_step: Decimal, grid_count: int, tick_size: Decimal
+) -> tuple[Decimal, ...]:
+    """
+    Arithmetic grid prices rounded down to tick size.
+
+    Works in whole tick counts: the range is scaled by the tick once, so each
+    level is a truncation and a multiply instead of a division plus quantize.
+    Results are cached per geometry, so fixed-range grids and repeated regrids
+    at the same price are built once; tick_size is part of the key, so a
+    symbol-info refresh never reuses stale prices.
+    """
+    base_ticks = lower / tick_size
+    step_ticks = grid_step / tick_size
+    return tuple(int(base_ticks + i * step_ticks) * tick_size for i in range(grid_count))
+
+
+@lru_cache(maxsize=32)
+def _grid_multipliers(range_fraction: Decimal, grid_count: int) -> tuple[Decimal, ...]:
+    """
+    Per-level price multipliers for a grid spanning ±range_fraction of its center.
+
+    Scaled by (grid_count - 1) so every entry stays exact:
+    level[i] = center × multiplier[i] / (grid_count - 1). Only the center moves
+    between regrids, so the vector is built once per range and count.
+    """
+    spaces = grid_count - 1
+    base = (1 - range_fraction) * spaces
+    span = 2 * range_fraction
+    return tuple(base + span * i for i in range(grid_count))
+
+
+def _tp_price_ticks(entry_price: Decimal, tp_percent: Decimal, tick_size: Decimal) -> Decimal:
+    """
+    Price `tp_percent` away from entry (negative for below), rounded down to tick size.
+
+    Scales straight into whole ticks, entry × (100 + pct) // (100 × tick), so the
+    target is one multiply and one integer division rather than a percent
+    division, a multiply and a separate tick rounding.
+    """
+    return (entry_price * (_D100 + tp_percent)) // (_D100 * tick_size) * tick_size
+
+
+@lru_cache(maxsize=8)
+def _risk_limits(
+    initial_balance: Decimal, max_drawdown_percent: Decimal, daily_loss_limit_percent: Decimal
+) -> tuple[Decimal, Decimal] | None:
+    """
+    Drawdown and daily-loss limits in USDT for a starting balance.
+
+    Returns (equity floor, daily loss cap) so the circuit breaker's
+    all-clear check is plain comparisons instead of percent divisions.
+    None when the percent form must be evaluated (no balance or a
+    non-positive limit).
+    """
+    if initial_balance <= 0 or max_drawdown_percent <= 0 or daily_loss_limit_percent <= 0:
+        return None
+    return (
+        initial_balance * (_D100 - max_drawdown_percent) / _D100,
+        initial_balance * daily_loss_limit_percent / _D100,
+    )
+
 
 class OrderSide(Enum):
     """Order direction."""
@@ -73,6 +212,12 @@ class OrderSide(Enum):
     SELL = "SELL"
 
 
+class PositionSide(IntEnum):
+    """Position direction; the value is the sign of price moves in its favour."""
+    LONG = 1
+    SHORT = -1
+
+
 class BotState(Enum):
     """Bot operational state."""
     INITIALIZING = "INITIALIZING"
@@ -82,6 +227,13 @@ class BotState(Enum):
     ERROR = "ERROR"
 
 
+class BreakerState(Enum):
+    """Daily-loss circuit breaker state."""
+    CLOSED = "CLOSED"        # Limit not hit, checked every tick
+    OPEN = "OPEN"            # Limit hit and bot paused; no re-check until the daily reset
+    HALF_OPEN = "HALF_OPEN"  # Daily window reset; next check decides whether to resume
+
+
 class GridLevelState(Enum):
     """State machine for grid level lifecycle."""
     EMPTY = "EMPTY"                    # No order, no position
@@ -91,7 +243,19 @@ class GridLevelState(Enum):
     SELL_PLACED = "SELL_PLACED"        # Regular SELL order placed
 
 
-@dataclass
+# Level states that hold an open position
+_HELD_STATES = (GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED)
+
+# C-level field getters for counting over GridState.levels
+_get_order_id = attrgetter("order_id")
+_get_position_quantity = attrgetter("position_quantity")
+
+# ORDER_TRADE_UPDATE fields read on every order event: orderId, status,
+# side, price, last executed quantity (always present in the payload)
+_order_update_fields = itemgetter("i", "X", "S", "p", "l")
+
+
+@dataclass(slots=True)
 class GridLevel:
     """
     Represents a single grid level with its order and position state.
@@ -108,7 +272,14 @@ class GridLevel:
         position_quantity: Quantity held at this level (accumulated from partial fills)
         tp_order_id: Take profit order ID (separate from regular order_id)
         partial_tp_order_ids: List of TP order IDs for partial fills
+        fill_notional: Sum of fill price * quantity, for the weighted entry price
         intended_price: Original intended price for slippage calculation
+        replace_quantity: Entry quantity pre-sized at TP placement, consumed
+            when the entry order is re-placed after the TP fills
+
+    state, order_id, tp_order_id and position_quantity feed the owning
+    GridState's counters and order-ID index, so they are only written
+    through the set_* methods. Other fields are plain slot writes.
     """
     index: int
     price: Decimal
@@ -118,25 +289,58 @@ class GridLevel:
     filled: bool = False
     # Position tracking
     state: GridLevelState = GridLevelState.EMPTY
-    entry_price: Decimal = Decimal("0")
-    position_quantity: Decimal = Decimal("0")
+    entry_price: Decimal = _D0
+    position_quantity: Decimal = _D0
     tp_order_id: int | None = None
     # Partial fill tracking
     partial_tp_order_ids: list[int] = field(default_factory=list)
     partial_fill_count: int = 0
+    fill_notional: Decimal = _D0  # Running sum of price * qty across fills
     # Slippage tracking
-    intended_price: Decimal = Decimal("0")
-    actual_fill_price: Decimal = Decimal("0")
-    slippage_percent: Decimal = Decimal("0")
+    intended_price: Decimal = _D0
+    actual_fill_price: Decimal = _D0
+    slippage_percent: float = 0.0  # Analytics only, never sent to the exchange
     # TP tracking for ML analysis
-    tp_placed_at: datetime | None = None
-    tp_target_price: Decimal = Decimal("0")
+    tp_placed_at: float | None = None  # time.monotonic() when the TP was placed
+    tp_target_price: Decimal = _D0
     # Trailing TP (SuperTrend-based) fields
     trailing_tp_active: bool = False       # Whether trailing mode is active
-    supertrend_stop: Decimal = Decimal("0")  # Current SuperTrend stop level
-    highest_price_seen: Decimal = Decimal("0")   # For LONG: track highest price
-    lowest_price_seen: Decimal = Decimal("999999")  # For SHORT: track lowest price
+    supertrend_stop: Decimal = _D0  # Current SuperTrend stop level
+    highest_price_seen: Decimal = _D0   # For LONG: track highest price
+    lowest_price_seen: Decimal = _D_PRICE_CEILING  # For SHORT: track lowest price
     last_tp_update: datetime | None = None  # Last time TP was updated
+    # Re-place sizing, computed off the fill path (kept across reset())
+    replace_quantity: Decimal | None = None
+    # GridState whose counters track this level (set when attached to state.levels)
+    _owner: "GridState | None" = field(default=None, repr=False, compare=False)
+
+    def set_state(self, state: GridLevelState) -> None:
+        """Move the level to a lifecycle state."""
+        old = self.state
+        self.state = state
+        if self._owner is not None and old is not state:
+            self._owner._on_state_change(self, old, state)
+
+    def set_order_id(self, order_id: int | None) -> None:
+        """Set (or clear) the active order ID."""
+        old = self.order_id
+        self.order_id = order_id
+        if self._owner is not None and old != order_id:
+            self._owner._on_order_id_change(self, old, order_id, True)
+
+    def set_tp_order_id(self, tp_order_id: int | None) -> None:
+        """Set (or clear) the take profit order ID."""
+        old = self.tp_order_id
+        self.tp_order_id = tp_order_id
+        if self._owner is not None and old != tp_order_id:
+            self._owner._on_order_id_change(self, old, tp_order_id, False)
+
+    def set_position_quantity(self, quantity: Decimal) -> None:
+        """Set the quantity held at this level."""
+        old = self.position_quantity
+        self.position_quantity = quantity
+        if self._owner is not None:
+            self._owner._total_position_qty += quantity - old
 
     def __repr__(self) -> str:
         if self.state == GridLevelState.POSITION_HELD:
@@ -153,25 +357,26 @@ class GridLevel:
     def reset(self) -> None:
         """Reset level to empty state after TP fill."""
         self.filled = False
-        self.state = GridLevelState.EMPTY
-        self.entry_price = Decimal("0")
-        self.position_quantity = Decimal("0")
-        self.order_id = None
-        self.tp_order_id = None
+        self.set_state(GridLevelState.EMPTY)
+        self.entry_price = _D0
+        self.set_position_quantity(_D0)
+        self.set_order_id(None)
+        self.set_tp_order_id(None)
         self.client_order_id = None
         self.partial_tp_order_ids = []
         self.partial_fill_count = 0
-        self.intended_price = Decimal("0")
-        self.actual_fill_price = Decimal("0")
-        self.slippage_percent = Decimal("0")
+        self.fill_notional = _D0
+        self.intended_price = _D0
+        self.actual_fill_price = _D0
+        self.slippage_percent = 0.0
         # TP tracking for ML analysis
         self.tp_placed_at = None
-        self.tp_target_price = Decimal("0")
+        self.tp_target_price = _D0
         # Trailing TP reset
         self.trailing_tp_active = False
-        self.supertrend_stop = Decimal("0")
-        self.highest_price_seen = Decimal("0")
-        self.lowest_price_seen = Decimal("999999")
+        self.supertrend_stop = _D0
+        self.highest_price_seen = _D0
+        self.lowest_price_seen = _D_PRICE_CEILING
         self.last_tp_update = None
 
     def add_partial_fill(self, price: Decimal, quantity: Decimal) -> None:
@@ -179,35 +384,47 @@ class GridLevel:
         Add a partial fill to this level's position.
 
         Updates entry_price as weighted average if there are multiple partial fills.
+        The average is derived from running notional/quantity sums, so each fill
+        costs one multiply and one divide and rounding never compounds.
         """
         if self.position_quantity == 0:
             # First fill
             self.entry_price = price
-            self.position_quantity = quantity
+            self.set_position_quantity(quantity)
+            self.fill_notional = price * quantity
         else:
+            if not self.fill_notional:
+                # Position was recorded directly (full fill), seed the sum from it
+                self.fill_notional = self.entry_price * self.position_quantity
             # Weighted average entry price
-            total_qty = self.position_quantity + quantity
-            self.entry_price = (
-                (self.entry_price * self.position_quantity + price * quantity) / total_qty
-            )
-            self.position_quantity = total_qty
+            self.fill_notional += price * quantity
+            self.set_position_quantity(self.position_quantity + quantity)
+            self.entry_price = self.fill_notional / self.position_quantity
 
         self.partial_fill_count += 1
-        self.state = GridLevelState.POSITION_HELD
+        self.set_state(GridLevelState.POSITION_HELD)
+
+    def calculate_slippage(self, fill_price: Decimal) -> float:
+        """
+        Calculate slippage percentage from intended price.
 
-    def calculate_slippage(self, fill_price: Decimal) -> Decimal:
-        """Calculate slippage percentage from intended price."""
+        Slippage only feeds logs, notifications and the ML event log, so it is
+        computed in float; prices themselves stay Decimal.
+        """
         if self.intended_price <= 0:
-            return Decimal("0")
+            return 0.0
 
         self.actual_fill_price = fill_price
-        self.slippage_percent = (
-            (fill_price - self.intended_price) / self.intended_price * 100
-        )
+        if fill_price == self.intended_price:
+            # Maker fills land exactly on the grid price
+            self.slippage_percent = 0.0
+            return 0.0
+        intended = float(self.intended_price)
+        self.slippage_percent = (float(fill_price) - intended) / intended * 100
         return self.slippage_percent
 
 
-@dataclass
+@dataclass(slots=True)
 class GridState:
     """
     Complete state of the grid trading system.
@@ -216,25 +433,25 @@ class GridState:
     for monitoring and decision-making.
     """
     # Grid configuration
-    lower_price: Decimal = Decimal("0")
-    upper_price: Decimal = Decimal("0")
-    grid_step: Decimal = Decimal("0")
-    entry_price: Decimal = Decimal("0")
+    lower_price: Decimal = _D0
+    upper_price: Decimal = _D0
+    grid_step: Decimal = _D0
+    entry_price: Decimal = _D0
 
     # Grid levels
     levels: list[GridLevel] = field(default_factory=list)
 
     # Financial tracking
-    initial_balance: Decimal = Decimal("0")
-    current_balance: Decimal = Decimal("0")
-    unrealized_pnl: Decimal = Decimal("0")
-    realized_pnl: Decimal = Decimal("0")
+    initial_balance: Decimal = _D0
+    current_balance: Decimal = _D0
+    unrealized_pnl: Decimal = _D0
+    realized_pnl: Decimal = _D0
     total_trades: int = 0
 
     # Phase 3: Risk Management Tracking
-    daily_realized_pnl: Decimal = Decimal("0")  # Resets daily
+    daily_realized_pnl: Decimal = _D0  # Resets daily
     daily_start_time: datetime | None = None
-    session_high_price: Decimal = Decimal("0")  # For trailing stop
+    session_high_price: Decimal = _D0  # For trailing stop
 
     # Timing
     start_time: datetime | None = None
@@ -243,42 +460,121 @@ class GridState:
     last_supertrend_flip_alert: datetime | None = None
 
     # Manual position close detection
-    last_known_position_amt: Decimal = Decimal("0")
+    last_known_position_amt: Decimal = _D0
+
+    # Latest observed market price (fills and mark price), monotonic timestamp
+    last_price: Decimal = _D0
+    last_price_ts: float = 0.0
+
+    # order_id / tp_order_id -> level, kept in step with level changes
+    _order_id_index: dict[int, GridLevel] = field(default_factory=dict, repr=False)
+
+    # state -> {id(level): level}, kept in step with level state changes
+    _levels_by_state: dict[GridLevelState, dict[int, GridLevel]] = field(
+        default_factory=dict, repr=False
+    )
+
+    # Counters kept in step with level transitions (see the GridLevel.set_* methods)
+    _active_orders_count: int = field(default=0, repr=False)
+    _total_position_qty: Decimal = field(default=_D0, repr=False)
+
+    def __post_init__(self) -> None:
+        self._attach_levels()
+
+    def replace_levels(self, levels: list[GridLevel]) -> None:
+        """Swap in a new set of grid levels, detaching the old ones from the counters."""
+        for level in self.levels:
+            level._owner = None
+        self.levels = levels
+        self._attach_levels()
+
+    def _attach_levels(self) -> None:
+        """Bind levels to this state and rebuild the counters and index with a full scan."""
+        levels = self.levels
+        index: dict[int, GridLevel] = {}
+        for level in levels:
+            level._owner = self
+            if level.order_id is not None:
+                index.setdefault(level.order_id, level)
+            if level.tp_order_id is not None:
+                index.setdefault(level.tp_order_id, level)
+        self._order_id_index = index
+        by_state: dict[GridLevelState, dict[int, GridLevel]] = {s: {} for s in GridLevelState}
+        for level in levels:
+            by_state[level.state][id(level)] = level
+        self._levels_by_state = by_state
+        self._active_orders_count = len(levels) - list(map(_get_order_id, levels)).count(None)
+        self._total_position_qty = sum(map(_get_position_quantity, levels), _D0)
+
+    def _on_state_change(self, level: GridLevel, old: GridLevelState, new: GridLevelState) -> None:
+        """Move a level between the per-state buckets."""
+        by_state = self._levels_by_state
+        del by_state[old][id(level)]
+        by_state[new][id(level)] = level
+
+    def _on_order_id_change(self, level: GridLevel, old: int | None, new: int | None, is_order: bool) -> None:
+        """Apply an order_id (is_order) or tp_order_id change to the counter and order-ID index."""
+        if is_order:
+            self._active_orders_count += (new is not None) - (old is not None)
+        index = self._order_id_index
+        # order_id may mirror tp_order_id, so keep the entry while either holds it
+        if (
+            old is not None
+            and index.get(old) is level
+            and old != level.order_id
+            and old != level.tp_order_id
+        ):
+            del index[old]
+        if new is not None:
+            index[new] = level
+
+    def reconcile_counters(self) -> bool:
+        """
+        Check the incremental counters and order-ID index against a full scan of the levels.
+
+        Any drift is corrected in place. Returns True if they were accurate.
+        """
+        before = (
+            self._levels_by_state, self._active_orders_count, self._total_position_qty,
+            self._order_id_index,
+        )
+        self._attach_levels()
+        return before == (
+            self._levels_by_state, self._active_orders_count, self._total_position_qty,
+            self._order_id_index,
+        )
     
     @property
     def drawdown_percent(self) -> Decimal:
         """Calculate current drawdown as percentage of initial balance."""
         if self.initial_balance <= 0:
-            return Decimal("0")
+            return _D0
         
         current_equity = self.current_balance + self.unrealized_pnl
         pnl = current_equity - self.initial_balance
         
         if pnl >= 0:
-            return Decimal("0")
+            return _D0
         
         return abs(pnl) / self.initial_balance * 100
     
     @property
     def active_orders_count(self) -> int:
         """Count of grid levels with active orders."""
-        return sum(1 for level in self.levels if level.order_id is not None)
+        return self._active_orders_count
 
     @property
     def positions_count(self) -> int:
         """Count of grid levels currently holding positions."""
-        return sum(
-            1 for level in self.levels
-            if level.state in (GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED)
-        )
+        return self.count_in_state(GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED)
 
     @property
     def daily_loss_percent(self) -> Decimal:
         """Calculate daily loss as percentage of initial balance."""
         if self.initial_balance <= 0:
-            return Decimal("0")
+            return _D0
         if self.daily_realized_pnl >= 0:
-            return Decimal("0")
+            return _D0
         return abs(self.daily_realized_pnl) / self.initial_balance * 100
     
     @property
@@ -288,35 +584,55 @@ class GridState:
     
     def get_level_by_order_id(self, order_id: int) -> GridLevel | None:
         """Find grid level by order ID (includes both regular and TP orders)."""
-        for level in self.levels:
-            if level.order_id == order_id or level.tp_order_id == order_id:
-                return level
-        return None
+        return self._order_id_index.get(order_id)
 
     def get_level_by_tp_order_id(self, tp_order_id: int) -> GridLevel | None:
         """Find grid level by TP order ID specifically."""
-        for level in self.levels:
-            if level.tp_order_id == tp_order_id:
-                return level
+        level = self.get_level_by_order_id(tp_order_id)
+        if level is not None and level.tp_order_id == tp_order_id:
+            return level
         return None
 
     def get_level_by_price(self, price: Decimal, tolerance: Decimal = Decimal("0.0001")) -> GridLevel | None:
         """Find grid level closest to given price within tolerance."""
-        for level in self.levels:
-            if abs(level.price - price) <= tolerance:
-                return level
+        levels = self.levels
+        if not levels:
+            return None
+
+        if self.grid_step <= tolerance:
+            # Tolerance spans several levels (or no step yet): scan in order
+            for level in levels:
+                if abs(level.price - price) <= tolerance:
+                    return level
+            return None
+
+        # Arithmetic grid: the index follows from the price directly. Level
+        # prices are rounded down to tick size, so also check the neighbours.
+        idx = int(round((price - self.lower_price) / self.grid_step))
+        for i in (idx - 1, idx, idx + 1):
+            if 0 <= i < len(levels) and abs(levels[i].price - price) <= tolerance:
+                return levels[i]
         return None
 
     def get_total_position_quantity(self) -> Decimal:
         """Get total position quantity across all grid levels."""
-        return sum(level.position_quantity for level in self.levels)
+        return self._total_position_qty
+
+    def count_in_state(self, *states: GridLevelState) -> int:
+        """Count the levels currently in any of the given states (no scan of all levels)."""
+        by_state = self._levels_by_state
+        return sum(len(by_state[state]) for state in states)
+
+    def get_levels_in_state(self, *states: GridLevelState) -> list[GridLevel]:
+        """Get the levels currently in any of the given states (no scan of all levels)."""
+        by_state = self._levels_by_state
+        if len(states) == 1:
+            return list(by_state[states[0]].values())
+        return [level for state in states for level in by_state[state].values()]
 
     def get_levels_with_position(self) -> list[GridLevel]:
         """Get all levels that are holding a position."""
-        return [
-            level for level in self.levels
-            if level.state in (GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED)
-        ]
+        return self.get_levels_in_state(*_HELD_STATES)
 
 
 class GridBot:
@@ -341,13 +657,62 @@ class GridBot:
         self.state = GridState()
         self.bot_state = BotState.INITIALIZING
         
+        # Fixed for the bot's lifetime; read on every stream event and risk tick
+        self.symbol: str = config.trading.SYMBOL
+        self.margin_asset: str = config.trading.MARGIN_ASSET
+        # Current grid direction; only changed through _set_grid_side()
+        self.grid_side: str = config.grid.GRID_SIDE
+
         # Symbol information (fetched from exchange)
         self.tick_size: Decimal = Decimal("0.0001")
         self.lot_size: Decimal = Decimal("0.01")
         self.min_notional: Decimal = Decimal("5")
+        # Float copy for the partial-fill filter (kept in step with min_notional)
+        self._min_notional_f: float = float(self.min_notional)
+        self._leverage: Decimal = Decimal(config.trading.LEVERAGE)
+        # ML event log output is configured once at startup
+        self._telemetry_enabled: bool = trade_event_logger.enabled
         
         # Shutdown handling
         self._shutdown_event = asyncio.Event()
+
+        # Strong references to background tasks (the event loop only keeps
+        # weak references, so untracked tasks can be garbage-collected mid-flight)
+        self._bg_tasks: set[asyncio.Task] = set()
+
+        # Fills from the user data stream, applied in order by _fill_worker()
+        self._fill_events: asyncio.Queue[tuple] = asyncio.Queue()
+
+        # Monotonic suffix for client order IDs (unique even within one second)
+        self._coid_counter = itertools.count(int(time.time() * 1000))
+
+        # Last set of inputs the circuit breaker was evaluated against
+        self._last_cb_inputs: tuple | None = None
+        self._breaker_state = BreakerState.CLOSED
+        # Raw "wb" string of the last applied balance push (None after a REST read)
+        self._last_balance_raw: str | None = None
+        # Monotonic time of the last full check made while flat (None: not flat)
+        self._cb_flat_checked_at: float | None = None
+        # Last account read (stream or REST) showed an exchange position for the
+        # symbol; unlike positions_count this includes positions no level tracks
+        self._exchange_position_open = False
+
+        # (monotonic fetch time, positions) from get_position_risk, dropped on fills
+        self._position_cache: tuple[float, list[dict]] | None = None
+        # Bumped on every fill and position update; a REST snapshot is only
+        # cached if none arrived while it was in flight
+        self._position_generation = 0
+        # A fill was seen but the stream hasn't pushed the resulting position yet
+        self._position_update_pending = False
+        # Monotonic time balance/positions were last known current (stream or REST)
+        self._account_ts: float = 0.0
+        # One external-close reset at a time; later triggers request a re-run
+        self._ext_close_lock = asyncio.Lock()
+        self._ext_close_pending = False
+
+        # Rolling 1h candles in REST kline row format, fed by run_kline_stream()
+        self._klines_cache: deque[list] = deque(maxlen=KLINE_CACHE_SIZE)
+        self._klines_ts: float = 0.0  # Monotonic time of the last stream update
         
         # Harvest mode tracking
         self._initial_orders_placed = False
@@ -362,13 +727,30 @@ class GridBot:
         self.strategy_manager = StrategyManager(self.client, bot_reference=self)
         self.indicator_analyzer = IndicatorAnalyzer()  # For trailing TP calculations
         self._session_id: int = 0
-        self._last_hourly_summary = datetime.now()
+        # Monotonic twin of state.daily_start_time for the daily reset check
+        self._daily_start_mono: float | None = None
     
     # =========================================================================
     # GRID CALCULATION
     # =========================================================================
 
-    async def get_dynamic_grid_range(self, current_price: Decimal) -> Decimal:
+    async def _get_atr_value(self) -> Decimal:
+        """
+        ATR for dynamic grid spacing.
+
+        Uses the strategy manager's last analysis or runs a fresh one.
+        Returns 0 when dynamic spacing is disabled.
+        """
+        if not config.grid.DYNAMIC_GRID_SPACING_ENABLED:
+            return _D0
+        if self.strategy_manager.last_analysis:
+            return self.strategy_manager.last_analysis.atr_value
+        analysis = await self.strategy_manager.analyze_market()
+        return analysis.atr_value
+
+    async def get_dynamic_grid_range(
+        self, current_price: Decimal, atr_value: Decimal | None = None
+    ) -> Decimal:
         """
         Calculate dynamic grid range based on ATR (volatility).
 
@@ -376,6 +758,10 @@ class GridBot:
             grid_range = ATR% × ATR_GRID_MULTIPLIER
             clamped to [MIN_GRID_RANGE_PERCENT, MAX_GRID_RANGE_PERCENT]
 
+        Args:
+            current_price: Price the new grid is centered on
+            atr_value: Pre-fetched ATR; looked up via _get_atr_value() if None
+
         Returns:
             Grid range percentage (e.g., 3.0 for ±3%)
         """
@@ -383,18 +769,12 @@ class GridBot:
             return config.grid.GRID_RANGE_PERCENT
 
         try:
-            # Get ATR from strategy manager's last analysis or calculate fresh
-            atr_percent = Decimal("0")
+            if atr_value is None:
+                atr_value = await self._get_atr_value()
 
-            if self.strategy_manager.last_analysis:
-                atr_value = self.strategy_manager.last_analysis.atr_value
-                if atr_value > 0 and current_price > 0:
-                    atr_percent = (atr_value / current_price) * 100
-            else:
-                # Fetch fresh analysis
-                analysis = await self.strategy_manager.analyze_market()
-                if analysis.atr_value > 0 and current_price > 0:
-                    atr_percent = (analysis.atr_value / current_price) * 100
+            atr_percent = _D0
+            if atr_value > 0 and current_price > 0:
+                atr_percent = (atr_value / current_price) * 100
 
             if atr_percent <= 0:
                 logger.warning("ATR is zero, using default grid range")
@@ -409,7 +789,7 @@ class GridBot:
 
             # Session-aware grid widening
             session_grid_mult = self._get_session_grid_multiplier()
-            if session_grid_mult != Decimal("1"):
+            if session_grid_mult != _D1:
                 dynamic_range = dynamic_range * session_grid_mult
                 # Re-clamp after session adjustment
                 dynamic_range = min(dynamic_range, config.grid.MAX_GRID_RANGE_PERCENT)
@@ -445,7 +825,10 @@ class GridBot:
         Returns:
             List of GridLevel objects with calculated prices
         """
+        grid_count = config.grid.GRID_COUNT
+
         # Determine price range
+        range_pct = None
         if config.grid.LOWER_PRICE and config.grid.UPPER_PRICE:
             lower = config.grid.LOWER_PRICE
             upper = config.grid.UPPER_PRICE
@@ -456,7 +839,6 @@ class GridBot:
             upper = current_price * (1 + range_pct)
         
         # Calculate grid step
-        grid_count = config.grid.GRID_COUNT
         grid_step = (upper - lower) / (grid_count - 1)
         
         # Store in state
@@ -465,52 +847,59 @@ class GridBot:
         self.state.grid_step = grid_step
         self.state.entry_price = current_price
         
-        # Generate levels
-        levels = []
-        for i in range(grid_count):
-            price = lower + (Decimal(i) * grid_step)
-            # Round to tick size
-            price = self._round_price(price)
-            
-            # Determine order side based on position relative to current price
-            if price < current_price:
-                side = OrderSide.BUY
-            elif price > current_price:
-                side = OrderSide.SELL
-            else:
-                # At current price - skip or use as reference
-                side = None
-            
-            # Filter by GRID_SIDE config
-            # LONG mode: only BUY orders (for bullish markets)
-            # SHORT mode: only SELL orders (for bearish markets)
-            # BOTH mode: traditional grid with both sides
-            grid_side = config.grid.GRID_SIDE
-            if grid_side == "LONG" and side == OrderSide.SELL:
-                side = None  # Skip SELL orders in LONG mode
-            elif grid_side == "SHORT" and side == OrderSide.BUY:
-                side = None  # Skip BUY orders in SHORT mode
-            
-            levels.append(GridLevel(
+        # Generate levels (prices already rounded to tick size, ascending)
+        if range_pct is None:
+            prices = _grid_prices(lower, grid_step, grid_count, self.tick_size)
+        else:
+            # Centered grid: scale the cached multipliers by the center price
+            # and floor straight into ticks
+            tick_size = self.tick_size
+            divisor = (grid_count - 1) * tick_size
+            prices = [
+                (current_price * multiplier) // divisor * tick_size
+                for multiplier in _grid_multipliers(range_pct, grid_count)
+            ]
+
+        # Filter by GRID_SIDE config
+        # LONG mode: only BUY orders (for bullish markets)
+        # SHORT mode: only SELL orders (for bearish markets)
+        # BOTH mode: traditional grid with both sides
+        grid_side = self.grid_side
+        buy_side = OrderSide.BUY if grid_side != "SHORT" else None
+        sell_side = OrderSide.SELL if grid_side != "LONG" else None
+
+        # Prices are sorted, so the BUY/SELL boundary is found once:
+        # below current price -> BUY, above -> SELL, at current price -> none
+        buy_end = bisect_left(prices, current_price)
+        sell_start = bisect_right(prices, current_price)
+
+        levels = [
+            GridLevel(
                 index=i,
                 price=price,
-                side=side,
-            ))
+                side=buy_side if i < buy_end else sell_side if i >= sell_start else None,
+            )
+            for i, price in enumerate(prices)
+        ]
         
         logger.info(f"Grid calculated: {grid_count} levels from {lower:.4f} to {upper:.4f}")
         logger.info(f"Grid step: {grid_step:.4f} ({grid_step/current_price*100:.2f}%)")
         
         return levels
     
+    def _apply_tp(self, entry_price: Decimal, tp_percent: Decimal, side: PositionSide) -> Decimal:
+        """TP price on tick: `tp_percent` above entry for LONG, below for SHORT."""
+        return _tp_price_ticks(entry_price, side * tp_percent, self.tick_size)
+
     def _round_price(self, price: Decimal) -> Decimal:
         """Round price to valid tick size."""
-        return (price / self.tick_size).quantize(Decimal("1"), ROUND_DOWN) * self.tick_size
+        return (price // self.tick_size) * self.tick_size
     
     def _round_quantity(self, quantity: Decimal) -> Decimal:
         """Round quantity to valid lot size."""
-        return (quantity / self.lot_size).quantize(Decimal("1"), ROUND_DOWN) * self.lot_size
+        return (quantity // self.lot_size) * self.lot_size
     
-    def calculate_quantity_for_level(self, price: Decimal) -> Decimal:
+    def calculate_quantity_for_level(self, price: Decimal, order_notional: Decimal | None = None) -> Decimal:
         """
         Calculate order quantity for a grid level.
 
@@ -523,24 +912,17 @@ class GridBot:
 
         Args:
             price: Order price
+            order_notional: Pre-computed effective_usdt * leverage from
+                _get_order_notional(), to reuse across many levels
 
         Returns:
             Quantity in base asset (rounded to lot size)
         """
-        usdt_per_grid = config.grid.QUANTITY_PER_GRID_USDT
-
-        # Volatility-based position sizing
-        vol_factor = self._get_volatility_size_factor()
-        usdt_per_grid = usdt_per_grid * vol_factor
-
-        # Session-aware position sizing
-        session_factor = self._get_session_size_factor()
-        usdt_per_grid = usdt_per_grid * session_factor
-
-        leverage = Decimal(config.trading.LEVERAGE)
+        if order_notional is None:
+            order_notional = self._get_order_notional()
 
         # Calculate base quantity
-        quantity = (usdt_per_grid * leverage) / price
+        quantity = order_notional / price
 
         # Round to lot size
         quantity = self._round_quantity(quantity)
@@ -554,6 +936,18 @@ class GridBot:
 
         return quantity
 
+    def _get_order_notional(self) -> Decimal:
+        """Leveraged per-grid order notional after volatility and session scaling."""
+        usdt_per_grid = config.grid.QUANTITY_PER_GRID_USDT
+
+        # Volatility-based position sizing
+        usdt_per_grid = usdt_per_grid * self._get_volatility_size_factor()
+
+        # Session-aware position sizing
+        usdt_per_grid = usdt_per_grid * self._get_session_size_factor()
+
+        return usdt_per_grid * self._leverage
+
     def _get_volatility_size_factor(self) -> Decimal:
         """
         Calculate position size scaling factor based on ATR volatility.
@@ -562,10 +956,10 @@ class GridBot:
         Linear interpolation between ATR_PERCENT_LOW and ATR_PERCENT_HIGH.
         """
         if not config.grid.VOLATILITY_POSITION_SIZING_ENABLED:
-            return Decimal("1")
+            return _D1
 
         # Get ATR% from last analysis
-        atr_percent = Decimal("0")
+        atr_percent = _D0
         if (
             self.strategy_manager.last_analysis
             and self.strategy_manager.last_analysis.atr_value > 0
@@ -577,20 +971,20 @@ class GridBot:
             )
 
         if atr_percent <= 0:
-            return Decimal("1")
+            return _D1
 
         low = config.grid.ATR_PERCENT_LOW
         high = config.grid.ATR_PERCENT_HIGH
         min_ratio = config.grid.MIN_POSITION_SIZE_RATIO
 
         if atr_percent <= low:
-            return Decimal("1")
+            return _D1
         elif atr_percent >= high:
             return min_ratio
         else:
             # Linear interpolation: 1.0 at low, min_ratio at high
             fraction = (atr_percent - low) / (high - low)
-            factor = Decimal("1") - fraction * (Decimal("1") - min_ratio)
+            factor = _D1 - fraction * (_D1 - min_ratio)
             return factor
 
     def _get_session_size_factor(self) -> Decimal:
@@ -604,7 +998,7 @@ class GridBot:
         - Late (21-00): Declining → smaller positions
         """
         if not config.grid.SESSION_AWARE_ENABLED:
-            return Decimal("1")
+            return _D1
 
         from datetime import timezone
         utc_hour = datetime.now(timezone.utc).hour
@@ -615,7 +1009,7 @@ class GridBot:
             return config.grid.US_SESSION_SIZE_MULTIPLIER
         else:
             # EU and Late sessions: normal size
-            return Decimal("1")
+            return _D1
 
     def _get_current_session_name(self) -> str:
         """Get human-readable name of current trading session."""
@@ -641,7 +1035,7 @@ class GridBot:
         Wider grids during low-quality sessions to avoid whipsaw fills.
         """
         if not config.grid.SESSION_AWARE_ENABLED:
-            return Decimal("1")
+            return _D1
 
         from datetime import timezone
         utc_hour = datetime.now(timezone.utc).hour
@@ -651,7 +1045,7 @@ class GridBot:
         elif config.grid.US_SESSION_START_UTC <= utc_hour < config.grid.US_SESSION_END_UTC:
             return config.grid.US_SESSION_GRID_MULTIPLIER
         else:
-            return Decimal("1")
+            return _D1
 
     # =========================================================================
     # ORDER MANAGEMENT
@@ -685,6 +1079,8 @@ class GridBot:
             )
             return
 
+        # Select levels to fill first, then submit them concurrently
+        pending_levels: list[GridLevel] = []
         for level in self.state.levels:
             if level.side is None:
                 continue
@@ -694,105 +1090,196 @@ class GridBot:
 
             # Check max positions limit for BUY orders (Phase 3)
             if level.side == OrderSide.BUY:
-                potential_positions = self.state.positions_count + orders_placed
+                potential_positions = current_positions + len(pending_levels)
                 if potential_positions >= max_positions:
                     logger.info(
                         f"Max positions limit ({max_positions}) reached, "
                         f"skipping remaining BUY orders"
                     )
                     break
-            
-            try:
-                quantity = self.calculate_quantity_for_level(level.price)
-                
-                # Determine order type
-                # In harvest mode, use MARKET for initial orders to maximize taker fees
-                if (
-                    config.harvest.HARVEST_MODE 
-                    and config.harvest.USE_MARKET_FOR_INITIAL
-                    and not self._initial_orders_placed
-                ):
-                    order_type = "MARKET"
-                    price = None
-                else:
-                    order_type = "LIMIT"
-                    price = level.price
-                
-                # Generate client order ID for tracking
-                client_order_id = f"grid_{level.index}_{int(datetime.now().timestamp())}"
-                level.client_order_id = client_order_id
-                
-                # Place order
-                response = await self.client.place_order(
-                    symbol=config.trading.SYMBOL,
-                    side=level.side.value,
-                    order_type=order_type,
-                    quantity=quantity,
-                    price=price,
-                    client_order_id=client_order_id,
-                )
-                
-                level.order_id = response.get("orderId")
-                # Set intended price for slippage tracking
-                level.intended_price = level.price
-                # Set state based on side
-                if level.side == OrderSide.BUY:
-                    level.state = GridLevelState.BUY_PLACED
-                else:
-                    level.state = GridLevelState.SELL_PLACED
-                orders_placed += 1
 
-                logger.info(
-                    f"Placed {level.side.value} {order_type} @ {level.price:.4f} | "
-                    f"Qty: {quantity} | OrderID: {level.order_id}"
+            pending_levels.append(level)
+
+        # Determine order type
+        # In harvest mode, use MARKET for initial orders to maximize taker fees
+        use_market = (
+            config.harvest.HARVEST_MODE
+            and config.harvest.USE_MARKET_FOR_INITIAL
+            and not self._initial_orders_placed
+        )
+
+        # Sizing inputs are the same for every level in this pass
+        order_notional = self._get_order_notional()
+        symbol = self.symbol
+
+        pending_orders: list[tuple[GridLevel, dict]] = []
+        for level in pending_levels:
+            try:
+                pending_orders.append(
+                    (level, self._build_grid_order(level, use_market, order_notional, symbol))
                 )
-                
-                # Small delay to avoid rate limits
-                await asyncio.sleep(0.1)
-                
-            except AsterAPIError as e:
-                logger.error(f"Failed to place order at level {level.index}: {e}")
             except Exception as e:
-                logger.error(f"Unexpected error placing order: {e}")
+                logger.error(f"Failed to prepare order at level {level.index}: {e}")
+
+        # Submit via the batch endpoint, one signed request per batch, with all
+        # batches in flight together so a full grid costs about one round-trip
+        batch_size = self.client.MAX_BATCH_ORDERS
+        batch_results = await asyncio.gather(*(
+            self._submit_grid_batch(pending_orders[start:start + batch_size])
+            for start in range(0, len(pending_orders), batch_size)
+        ))
+
+        # Track the price range of accepted orders
+        min_price: Decimal | None = None
+        max_price: Decimal | None = None
+        for placed in batch_results:
+            for level in placed:
+                orders_placed += 1
+                if min_price is None or level.price < min_price:
+                    min_price = level.price
+                if max_price is None or level.price > max_price:
+                    max_price = level.price
         
         self._initial_orders_placed = True
         logger.info(f"Total orders placed: {orders_placed}")
 
         # Send Telegram notification for placed orders
         if orders_placed > 0:
-            # Find price range of placed orders
-            placed_levels = [
-                level for level in self.state.levels
-                if level.order_id is not None and level.state in (GridLevelState.BUY_PLACED, GridLevelState.SELL_PLACED)
-            ]
-            if placed_levels:
-                prices = [level.price for level in placed_levels]
-                price_range = (min(prices), max(prices))
-                side = "BUY" if config.grid.GRID_SIDE == "LONG" else "SELL"
-                await self.telegram.send_orders_placed(
-                    orders_count=orders_placed,
-                    side=side,
-                    price_range=price_range,
-                    grid_side=config.grid.GRID_SIDE,
-                )
+            side = "BUY" if self.grid_side == "LONG" else "SELL"
+            await self.telegram.send_orders_placed(
+                orders_count=orders_placed,
+                side=side,
+                price_range=(min_price, max_price),
+                grid_side=self.grid_side,
+            )
     
+    def _build_grid_order(
+        self, level: GridLevel, use_market: bool, order_notional: Decimal, symbol: str
+    ) -> dict:
+        """Build place_order arguments for a grid level and tag it with a client order ID."""
+        quantity = self.calculate_quantity_for_level(level.price, order_notional)
+
+        # Generate client order ID for tracking
+        client_order_id = f"grid_{level.index}_{next(self._coid_counter)}"
+        level.client_order_id = client_order_id
+
+        return {
+            "symbol": symbol,
+            "side": level.side.value,
+            "order_type": "MARKET" if use_market else "LIMIT",
+            "quantity": quantity,
+            "price": None if use_market else level.price,
+            "client_order_id": client_order_id,
+        }
+
+    async def _submit_grid_batch(self, batch: list[tuple[GridLevel, dict]]) -> list[GridLevel]:
+        """
+        Submit one exchange batch of grid orders and record accepted ones on their levels.
+
+        Returns:
+            Levels whose orders were accepted
+        """
+        try:
+            responses = await self.client.place_batch_orders([order for _, order in batch])
+        except AsterAPIError as e:
+            logger.error(f"Failed to place order batch ({len(batch)} orders): {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error placing order batch: {e}")
+            return []
+
+        placed = []
+        # Responses come back in request order; failed entries carry code/msg
+        for (level, order), response in zip(batch, responses):
+            order_id = response.get("orderId")
+            if order_id is None:
+                logger.error(
+                    f"Failed to place order at level {level.index}: "
+                    f"Error {response.get('code')}: {response.get('msg')}"
+                )
+                continue
+
+            level.set_order_id(order_id)
+            # Set intended price for slippage tracking
+            level.intended_price = level.price
+            # Set state based on side
+            if level.side == OrderSide.BUY:
+                level.set_state(GridLevelState.BUY_PLACED)
+            else:
+                level.set_state(GridLevelState.SELL_PLACED)
+            placed.append(level)
+
+            logger.info(
+                f"Placed {level.side.value} {order['order_type']} @ {level.price:.4f} | "
+                f"Qty: {order['quantity']} | OrderID: {level.order_id}"
+            )
+        return placed
+
     async def cancel_all_orders(self) -> None:
         """Cancel all open orders for the trading symbol."""
         try:
-            await self.client.cancel_all_orders(config.trading.SYMBOL)
+            await self.client.cancel_all_orders(self.symbol)
 
             # Clear order IDs and reset states (preserve position info for levels with positions)
             for level in self.state.levels:
-                level.order_id = None
-                level.tp_order_id = None
+                level.set_order_id(None)
+                level.set_tp_order_id(None)
                 # Only reset state if no position held
                 if level.state not in (GridLevelState.POSITION_HELD,):
-                    level.state = GridLevelState.EMPTY
+                    level.set_state(GridLevelState.EMPTY)
 
             logger.info("All orders canceled")
         except AsterAPIError as e:
             logger.error(f"Failed to cancel all orders: {e}")
 
+    async def _cancel_and_price_grid(self) -> tuple[Decimal, Decimal]:
+        """
+        Cancel all orders while fetching the inputs for a new grid.
+
+        Cancel, price and ATR lookup are independent, so they run concurrently
+        and the new grid is ready after one round-trip instead of three.
+
+        Returns:
+            (current_price, grid_range_percent)
+        """
+        cancelled, current_price, atr_value = await asyncio.gather(
+            self.cancel_all_orders(),
+            self._get_current_price(),
+            self._get_atr_value(),
+            return_exceptions=True,
+        )
+        for result in (cancelled, current_price):
+            if isinstance(result, BaseException):
+                raise result
+        if isinstance(atr_value, BaseException):
+            # Fall back to the default range, as get_dynamic_grid_range would
+            logger.error(f"Error calculating dynamic grid range: {atr_value}")
+            atr_value = _D0
+        grid_range = await self.get_dynamic_grid_range(current_price, atr_value)
+        return current_price, grid_range
+
+    async def _wait_no_open_orders(
+        self, timeout: float = 5.0, poll_interval: float = OPEN_ORDERS_POLL_SECONDS
+    ) -> bool:
+        """
+        Poll until the exchange reports no open orders for the symbol.
+
+        Returns:
+            True once the book is clear, False if `timeout` elapsed first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                if not await self.client.get_open_orders(self.symbol):
+                    return True
+            except AsterAPIError as e:
+                logger.debug("Open orders poll failed: %s", e)
+            if loop.time() >= deadline:
+                logger.warning(f"Open orders still present after {timeout}s")
+                return False
+            await asyncio.sleep(poll_interval)
+
     async def close_all_positions(self) -> dict:
         """
         Close all open positions with market orders.
@@ -809,8 +1296,8 @@ class GridBot:
         result = {
             "success": False,
             "closed_count": 0,
-            "total_quantity": Decimal("0"),
-            "realized_pnl": Decimal("0"),
+            "total_quantity": _D0,
+            "realized_pnl": _D0,
             "error": None
         }
 
@@ -819,44 +1306,60 @@ class GridBot:
             await self.cancel_all_orders()
 
             # Get actual positions from exchange
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
+            positions = await self.client.get_position_risk(self.symbol)
 
             closed_count = 0
-            total_qty = Decimal("0")
-            total_pnl = Decimal("0")
+            total_qty = _D0
+            total_pnl = _D0
 
+            # (position_amt, entry_price) for every non-zero position
+            open_positions = []
             for pos in positions:
                 position_amt = Decimal(pos.get("positionAmt", "0"))
                 if position_amt == 0:
                     continue
 
                 entry_price = Decimal(pos.get("entryPrice", "0"))
-
-                # Determine close order side (opposite of position)
-                close_side = "SELL" if position_amt > 0 else "BUY"
-                close_qty = abs(position_amt)
+                open_positions.append((position_amt, entry_price))
 
                 logger.info(
-                    f"Closing position: {close_side} {close_qty} @ MARKET | "
-                    f"Entry: ${entry_price:.4f}"
+                    f"Closing position: {'SELL' if position_amt > 0 else 'BUY'} "
+                    f"{abs(position_amt)} @ MARKET | Entry: ${entry_price:.4f}"
                 )
 
-                # Place market order to close
-                order_result = await self.client.place_order(
-                    symbol=config.trading.SYMBOL,
-                    side=close_side,
-                    order_type="MARKET",
-                    quantity=close_qty,
-                    reduce_only=True
-                )
+            # Send all market closes at once (close side is opposite of position)
+            order_results = await asyncio.gather(
+                *(
+                    self.client.place_order(
+                        symbol=self.symbol,
+                        side="SELL" if position_amt > 0 else "BUY",
+                        order_type="MARKET",
+                        quantity=abs(position_amt),
+                        reduce_only=True
+                    )
+                    for position_amt, _ in open_positions
+                ),
+                return_exceptions=True,
+            )
+
+            market_price: Decimal | None = None
+            failures = []
+            for (position_amt, entry_price), order_result in zip(open_positions, order_results):
+                if isinstance(order_result, Exception):
+                    logger.error(f"Failed to close position {position_amt}: {order_result}")
+                    failures.append(str(order_result))
+                    continue
 
                 if order_result:
+                    close_qty = abs(position_amt)
+
                     # Get fill price from order result
                     fill_price = Decimal(order_result.get("avgPrice", "0"))
                     if fill_price == 0:
-                        # Estimate from current market price
-                        ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-                        fill_price = Decimal(ticker["price"])
+                        # Estimate from current market price (fetched once)
+                        if market_price is None:
+                            market_price = await self._get_current_price()
+                        fill_price = market_price
 
                     # Calculate PnL
                     if position_amt > 0:  # LONG position
@@ -873,15 +1376,24 @@ class GridBot:
                         f"PnL: {pnl:+.4f}"
                     )
 
+            if failures:
+                # Book what did close, but report the failure to the caller
+                self.state.realized_pnl += total_pnl
+                self.state.daily_realized_pnl += total_pnl
+                result["closed_count"] = closed_count
+                result["total_quantity"] = total_qty
+                result["realized_pnl"] = total_pnl
+                result["error"] = failures[0]
+                return result
+
             # Reset all grid levels that were holding positions
-            for level in self.state.levels:
-                if level.state in (GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED):
-                    level.reset()
+            for level in self.state.get_levels_with_position():
+                level.reset()
 
             # Update state tracking
             self.state.realized_pnl += total_pnl
             self.state.daily_realized_pnl += total_pnl
-            self.state.last_known_position_amt = Decimal("0")
+            self.state.last_known_position_amt = _D0
 
             result["success"] = True
             result["closed_count"] = closed_count
@@ -933,7 +1445,7 @@ class GridBot:
 
         # Clear regular order_id (tp_order_id handled separately)
         if filled_level.state != GridLevelState.TP_PLACED:
-            filled_level.order_id = None
+            filled_level.set_order_id(None)
         
         # Check if Dynamic Grid Rebalancing is enabled
         if getattr(config.grid, 'DYNAMIC_GRID_REBALANCE', False):
@@ -954,20 +1466,13 @@ class GridBot:
         )
 
         try:
-            # Cancel all existing orders
-            await self.cancel_all_orders()
-
-            # Get current market price
-            ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-            current_price = Decimal(ticker["price"])
+            # Cancel all existing orders while fetching price and volatility
+            current_price, grid_range = await self._cancel_and_price_grid()
 
             logger.info(f"🔄 DYNAMIC REBALANCE: Recalculating grid from ${current_price:.4f}")
 
-            # Calculate dynamic grid range
-            grid_range = await self.get_dynamic_grid_range(current_price)
-
             # Recalculate grid levels centered on current price
-            self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+            self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
             self.state.entry_price = current_price
 
             # Place new grid orders
@@ -998,7 +1503,7 @@ class GridBot:
             log_action = "SELL filled -> placing BUY"
         
         # Check GRID_SIDE config - handle special cases for LONG/SHORT only modes
-        grid_side = config.grid.GRID_SIDE
+        grid_side = self.grid_side
         
         if grid_side == "LONG" and new_side == OrderSide.SELL:
             # LONG mode: Instead of regular counter-order, place Smart TP
@@ -1032,7 +1537,7 @@ class GridBot:
         
         # Skip if target already has an order
         if target_level.order_id is not None:
-            logger.debug(f"Target level {target_index} already has order - skipping")
+            logger.debug("Target level %s already has order - skipping", target_index)
             return
         
         try:
@@ -1051,12 +1556,12 @@ class GridBot:
                 order_type = "LIMIT"
                 price = target_level.price
             
-            client_order_id = f"grid_{target_level.index}_{int(datetime.now().timestamp())}"
+            client_order_id = f"grid_{target_level.index}_{next(self._coid_counter)}"
             target_level.client_order_id = client_order_id
             target_level.side = new_side
             
             response = await self.client.place_order(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side=new_side.value,
                 order_type=order_type,
                 quantity=quantity,
@@ -1064,7 +1569,7 @@ class GridBot:
                 client_order_id=client_order_id,
             )
             
-            target_level.order_id = response.get("orderId")
+            target_level.set_order_id(response.get("orderId"))
             
             logger.info(
                 f"REBALANCE: {log_action} @ {target_level.price:.4f} | "
@@ -1093,22 +1598,25 @@ class GridBot:
         """
         try:
             # Get TOTAL position entry price from exchange
-            # This ensures TP is always above avg entry to avoid realized loss
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
-            total_entry_price = Decimal("0")
+            # This ensures TP is always above avg entry to avoid realized loss.
+            # Trailing TP candles don't depend on it, so fetch them alongside.
+            candles = None
+            if config.risk.USE_TRAILING_TP:
+                positions, candles = await asyncio.gather(
+                    self._get_positions_cached(), self._get_candles(100)
+                )
+            else:
+                positions = await self._get_positions_cached()
+            total_entry_price = _D0
 
+            # Positions are already scoped to the trading symbol
             actual_position_side = None
             for pos in positions:
-                if pos.get("symbol") == config.trading.SYMBOL:
-                    pos_amt = Decimal(pos.get("positionAmt", "0"))
-                    if pos_amt > 0:  # LONG position
-                        total_entry_price = Decimal(pos.get("entryPrice", "0"))
-                        actual_position_side = "LONG"
-                        break
-                    elif pos_amt < 0:  # SHORT position
-                        total_entry_price = Decimal(pos.get("entryPrice", "0"))
-                        actual_position_side = "SHORT"
-                        break
+                pos_amt = Decimal(pos.get("positionAmt", "0"))
+                if pos_amt:
+                    total_entry_price = Decimal(pos.get("entryPrice", "0"))
+                    actual_position_side = PositionSide.LONG if pos_amt > 0 else PositionSide.SHORT
+                    break
 
             # Use total position entry if available, otherwise use level entry
             level_entry = filled_level.entry_price if filled_level.entry_price > 0 else filled_level.price
@@ -1126,19 +1634,18 @@ class GridBot:
             trend = ""
             atr_percent = 0.0
             tp_mode = "fixed"  # "fixed" or "trailing"
+            tp_percent: Decimal | None = None  # Set by percent-based branches
 
             # Determine position side for trailing TP - use ACTUAL position side, not config
-            position_side = actual_position_side if actual_position_side else ("LONG" if config.grid.GRID_SIDE == "LONG" else "SHORT")
+            if actual_position_side is not None:
+                side = actual_position_side
+            else:
+                side = PositionSide.LONG if self.grid_side == "LONG" else PositionSide.SHORT
+            position_side = side.name  # "LONG"/"SHORT" for indicators and messages
 
             # Check if trailing TP is enabled
             if config.risk.USE_TRAILING_TP:
-                # Fetch candles for SuperTrend calculation
-                candles = await self.client.get_klines(
-                    symbol=config.trading.SYMBOL,
-                    interval="1h",
-                    limit=100  # Need more candles for SuperTrend
-                )
-
+                # Candles for SuperTrend calculation were fetched with the positions
                 if candles:
                     # Use IndicatorAnalyzer to get trailing TP recommendation
                     trailing_result = self.indicator_analyzer.get_trailing_tp(
@@ -1168,11 +1675,7 @@ class GridBot:
                 else:
                     # No candles - use fallback
                     tp_percent = config.risk.FALLBACK_TP_PERCENT
-                    if position_side == "LONG":
-                        tp_price = entry_price * (Decimal("1") + tp_percent / Decimal("100"))
-                    else:  # SHORT
-                        tp_price = entry_price * (Decimal("1") - tp_percent / Decimal("100"))
-                    tp_price = self._round_price(tp_price)
+                    tp_price = self._apply_tp(entry_price, tp_percent, side)
                     logger.warning(f"No candle data for trailing TP, using fallback: {tp_percent}%")
 
             elif config.risk.USE_SMART_TP:
@@ -1187,11 +1690,7 @@ class GridBot:
                     trend = cached_analysis.trend_direction
                     atr_percent = float(cached_analysis.atr_value / cached_analysis.current_price * 100) if cached_analysis.current_price > 0 else 0.0
                 else:
-                    candles = await self.client.get_klines(
-                        symbol=config.trading.SYMBOL,
-                        interval="1h",
-                        limit=50
-                    )
+                    candles = await self._get_candles(50)
 
                     if candles:
                         tp_percent = await get_smart_tp(candles=candles, position_side=position_side)
@@ -1200,32 +1699,24 @@ class GridBot:
                         tp_percent = config.risk.DEFAULT_TP_PERCENT
                         logger.warning(f"No candle data, using default TP: {tp_percent}%")
 
-                if position_side == "LONG":
-                    tp_price = entry_price * (Decimal("1") + tp_percent / Decimal("100"))
-                else:  # SHORT
-                    tp_price = entry_price * (Decimal("1") - tp_percent / Decimal("100"))
-                tp_price = self._round_price(tp_price)
+                tp_price = self._apply_tp(entry_price, tp_percent, side)
             else:
                 tp_percent = config.risk.DEFAULT_TP_PERCENT
-                if position_side == "LONG":
-                    tp_price = entry_price * (Decimal("1") + tp_percent / Decimal("100"))
-                else:  # SHORT
-                    tp_price = entry_price * (Decimal("1") - tp_percent / Decimal("100"))
-                tp_price = self._round_price(tp_price)
+                tp_price = self._apply_tp(entry_price, tp_percent, side)
                 logger.info(f"Smart TP disabled, using default: {tp_percent}%")
 
             # Use actual position quantity, not recalculated
             quantity = filled_level.position_quantity if filled_level.position_quantity > 0 else self.calculate_quantity_for_level(entry_price)
             
             # Generate client order ID
-            client_order_id = f"tp_{filled_level.index}_{int(datetime.now().timestamp())}"
+            client_order_id = f"tp_{filled_level.index}_{next(self._coid_counter)}"
 
             # Determine TP order side: LONG position closes with SELL, SHORT position closes with BUY
-            tp_order_side = "SELL" if position_side == "LONG" else "BUY"
+            tp_order_side = "SELL" if side is PositionSide.LONG else "BUY"
 
             # Place TP order
             response = await self.client.place_order(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side=tp_order_side,
                 order_type="LIMIT",
                 quantity=quantity,
@@ -1236,23 +1727,23 @@ class GridBot:
             order_id = response.get("orderId")
 
             # Store TP order info separately from entry order
-            filled_level.tp_order_id = order_id
-            filled_level.state = GridLevelState.TP_PLACED
-            filled_level.side = OrderSide.SELL if position_side == "LONG" else OrderSide.BUY
+            filled_level.set_tp_order_id(order_id)
+            filled_level.set_state(GridLevelState.TP_PLACED)
+            filled_level.side = OrderSide.SELL if side is PositionSide.LONG else OrderSide.BUY
             filled_level.client_order_id = client_order_id
             # Keep order_id pointing to TP for backward compatibility with get_level_by_order_id
-            filled_level.order_id = order_id
+            filled_level.set_order_id(order_id)
             # Track TP placement time and target for ML outcome analysis
-            filled_level.tp_placed_at = datetime.now()
+            filled_level.tp_placed_at = time.monotonic()
             filled_level.tp_target_price = tp_price
+            # Size the re-placed entry now, so the TP fill only needs the REST call
+            filled_level.replace_quantity = self.calculate_quantity_for_level(filled_level.price)
             filled_level.last_tp_update = datetime.now()
 
             # Calculate TP percentage for logging (always show as positive profit %)
-            if 'tp_percent' not in dir() or tp_percent is None:
-                if position_side == "LONG":
-                    tp_percent = ((tp_price - entry_price) / entry_price) * 100
-                else:  # SHORT - profit when price goes down
-                    tp_percent = ((entry_price - tp_price) / entry_price) * 100
+            if tp_percent is None:
+                # SHORT profits when price goes down, so the sign flips
+                tp_percent = (side * (tp_price - entry_price) / entry_price) * 100
 
             # Different log messages based on TP mode
             if tp_mode == "trailing":
@@ -1260,7 +1751,7 @@ class GridBot:
                     f"📈 TRAILING TP PLACED: {tp_order_side} @ ${tp_price:.4f} (+{tp_percent:.2f}%) | "
                     f"Avg Entry: ${entry_price:.4f} | Qty: {quantity} | OrderID: {order_id}"
                 )
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"📈 Trailing TP Placed (SuperTrend)!\n"
                     f"Position: {position_side}\n"
                     f"Avg Entry: ${entry_price:.4f}\n"
@@ -1273,7 +1764,7 @@ class GridBot:
                     f"🎯 SMART TP PLACED: {tp_order_side} @ ${tp_price:.4f} (+{tp_percent:.2f}%) | "
                     f"Avg Entry: ${entry_price:.4f} | Qty: {quantity} | OrderID: {order_id}"
                 )
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🎯 Smart TP Placed!\n"
                     f"Position: {position_side}\n"
                     f"Avg Entry: ${entry_price:.4f}\n"
@@ -1282,29 +1773,30 @@ class GridBot:
                     f"(TP based on total position avg)"
                 )
 
-            # Get context data for ML logging
-            btc_trend_score = 0
-            if self.strategy_manager.btc_trend_score:
-                btc_trend_score = self.strategy_manager.btc_trend_score.total
-            funding_rate = float(self.strategy_manager.last_funding_rate * 100)
-            drawdown_pct = float(self.state.drawdown_percent)
-
-            # Log trade event with full indicator values for ML analysis
-            trade_event_logger.log_smart_tp(
-                entry_price=entry_price,
-                tp_price=tp_price,
-                tp_percent=tp_percent,
-                rsi=rsi,
-                macd_hist=macd_hist,
-                trend=trend,
-                grid_level=filled_level.index,
-                position_quantity=quantity,
-                atr_percent=atr_percent,
-                btc_trend_score=btc_trend_score,
-                funding_rate=funding_rate,
-                drawdown_percent=drawdown_pct,
-                order_id=str(order_id),
-            )
+            # Context data only feeds the ML event log
+            if self._telemetry_enabled:
+                btc_trend_score = 0
+                if self.strategy_manager.btc_trend_score:
+                    btc_trend_score = self.strategy_manager.btc_trend_score.total
+                funding_rate = float(self.strategy_manager.last_funding_rate * 100)
+                drawdown_pct = float(self.state.drawdown_percent)
+
+                # Log trade event with full indicator values for ML analysis
+                trade_event_logger.log_smart_tp(
+                    entry_price=entry_price,
+                    tp_price=tp_price,
+                    tp_percent=tp_percent,
+                    rsi=rsi,
+                    macd_hist=macd_hist,
+                    trend=trend,
+                    grid_level=filled_level.index,
+                    position_quantity=quantity,
+                    atr_percent=atr_percent,
+                    btc_trend_score=btc_trend_score,
+                    funding_rate=funding_rate,
+                    drawdown_percent=drawdown_pct,
+                    order_id=str(order_id),
+                )
             
         except AsterAPIError as e:
             logger.error(f"Failed to place Smart TP order: {e}")
@@ -1338,7 +1830,7 @@ class GridBot:
                 # Re-place BUY at the original level
                 await self._re_place_buy(filled_level)
                 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🔄 TP Filled → BUY Re-placed\n\n"
                     f"Level: {filled_level.index}\n"
                     f"Same trend continues ✅"
@@ -1348,21 +1840,16 @@ class GridBot:
                 # Full re-grid
                 logger.warning("🔄 Trend changed - Full Re-Grid triggered")
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🔄 Trend Changed → Full Re-Grid\n\n"
                     f"Canceling all orders and repositioning..."
                 )
 
-                await self.cancel_all_orders()
-
-                ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-                current_price = Decimal(ticker["price"])
-
-                # Calculate dynamic grid range
-                grid_range = await self.get_dynamic_grid_range(current_price)
+                # Cancel while fetching price and volatility for the new grid
+                current_price, grid_range = await self._cancel_and_price_grid()
 
                 self.state.entry_price = current_price
-                self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+                self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
 
                 await self.place_grid_orders()
 
@@ -1372,11 +1859,11 @@ class GridBot:
                 # Record new grid placement
                 self.strategy_manager.record_grid_placement()
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"✅ Re-Grid Complete!\n\n"
                     f"New Center: ${current_price:.2f}\n"
                     f"Range: ±{grid_range:.2f}%\n"
-                    f"Orders: {len([l for l in self.state.levels if l.order_id])}"
+                    f"Orders: {self.state.active_orders_count}"
                 )
 
             elif action == "WAIT":
@@ -1392,16 +1879,17 @@ class GridBot:
     async def _re_place_buy(self, level: GridLevel) -> None:
         """Re-place a BUY order at the specified grid level."""
         try:
-            quantity = self.calculate_quantity_for_level(level.price)
-            client_order_id = f"grid_{level.index}_{int(datetime.now().timestamp())}"
+            quantity = level.replace_quantity or self.calculate_quantity_for_level(level.price)
+            level.replace_quantity = None
+            client_order_id = f"grid_{level.index}_{next(self._coid_counter)}"
 
             level.side = OrderSide.BUY
             level.client_order_id = client_order_id
-            level.state = GridLevelState.BUY_PLACED
+            level.set_state(GridLevelState.BUY_PLACED)
             level.filled = False
 
             response = await self.client.place_order(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side="BUY",
                 order_type="LIMIT",
                 quantity=quantity,
@@ -1409,7 +1897,7 @@ class GridBot:
                 client_order_id=client_order_id,
             )
 
-            level.order_id = response.get("orderId")
+            level.set_order_id(response.get("orderId"))
 
             logger.info(f"📥 BUY re-placed: ${level.price:.4f} | Level {level.index}")
 
@@ -1419,16 +1907,17 @@ class GridBot:
     async def _re_place_sell(self, level: GridLevel) -> None:
         """Re-place a SELL order at the specified grid level (for SHORT mode)."""
         try:
-            quantity = self.calculate_quantity_for_level(level.price)
-            client_order_id = f"grid_{level.index}_{int(datetime.now().timestamp())}"
+            quantity = level.replace_quantity or self.calculate_quantity_for_level(level.price)
+            level.replace_quantity = None
+            client_order_id = f"grid_{level.index}_{next(self._coid_counter)}"
 
             level.side = OrderSide.SELL
             level.client_order_id = client_order_id
-            level.state = GridLevelState.SELL_PLACED  # SHORT mode starts with SELL
+            level.set_state(GridLevelState.SELL_PLACED)  # SHORT mode starts with SELL
             level.filled = False
 
             response = await self.client.place_order(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side="SELL",
                 order_type="LIMIT",
                 quantity=quantity,
@@ -1436,7 +1925,7 @@ class GridBot:
                 client_order_id=client_order_id,
             )
 
-            level.order_id = response.get("orderId")
+            level.set_order_id(response.get("orderId"))
 
             logger.info(f"📤 SELL re-placed: ${level.price:.4f} | Level {level.index}")
 
@@ -1447,15 +1936,15 @@ class GridBot:
         """Place a single grid order at the specified level (used by _ensure_max_orders)."""
         try:
             quantity = self.calculate_quantity_for_level(level.price)
-            client_order_id = f"grid_{level.index}_{int(datetime.now().timestamp())}"
+            client_order_id = f"grid_{level.index}_{next(self._coid_counter)}"
 
             level.side = OrderSide.BUY if side == "BUY" else OrderSide.SELL
             level.client_order_id = client_order_id
-            level.state = GridLevelState.BUY_PLACED if side == "BUY" else GridLevelState.SELL_PLACED
+            level.set_state(GridLevelState.BUY_PLACED if side == "BUY" else GridLevelState.SELL_PLACED)
             level.filled = False
 
             response = await self.client.place_order(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side=side,
                 order_type="LIMIT",
                 quantity=quantity,
@@ -1463,14 +1952,14 @@ class GridBot:
                 client_order_id=client_order_id,
             )
 
-            level.order_id = response.get("orderId")
+            level.set_order_id(response.get("orderId"))
             logger.info(f"📋 {side} placed: ${level.price:.4f} | Level {level.index}")
 
         except AsterAPIError as e:
             logger.error(f"Failed to place {side} order at level {level.index}: {e}")
             # Reset state on failure
-            level.state = GridLevelState.EMPTY
-            level.order_id = None
+            level.set_state(GridLevelState.EMPTY)
+            level.set_order_id(None)
 
     async def _handle_tp_buy_filled(self, filled_level: GridLevel) -> None:
         """
@@ -1499,7 +1988,7 @@ class GridBot:
                 # Re-place SELL at the original level
                 await self._re_place_sell(filled_level)
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🔄 TP Filled → SELL Re-placed\n\n"
                     f"Level: {filled_level.index}\n"
                     f"Same trend continues ✅"
@@ -1509,21 +1998,16 @@ class GridBot:
                 # Full re-grid
                 logger.warning("🔄 Trend changed - Full Re-Grid triggered")
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🔄 Trend Changed → Full Re-Grid\n\n"
                     f"Canceling all orders and repositioning..."
                 )
 
-                await self.cancel_all_orders()
-
-                ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-                current_price = Decimal(ticker["price"])
-
-                # Calculate dynamic grid range
-                grid_range = await self.get_dynamic_grid_range(current_price)
+                # Cancel while fetching price and volatility for the new grid
+                current_price, grid_range = await self._cancel_and_price_grid()
 
                 self.state.entry_price = current_price
-                self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+                self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
 
                 await self.place_grid_orders()
 
@@ -1533,11 +2017,11 @@ class GridBot:
                 # Record new grid placement
                 self.strategy_manager.record_grid_placement()
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"✅ Re-Grid Complete!\n\n"
                     f"New Center: ${current_price:.2f}\n"
                     f"Range: ±{grid_range:.2f}%\n"
-                    f"Orders: {len([l for l in self.state.levels if l.order_id])}"
+                    f"Orders: {self.state.active_orders_count}"
                 )
 
             elif action == "WAIT":
@@ -1592,13 +2076,12 @@ class GridBot:
             Number of positions synced
         """
         try:
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
+            positions = await self._get_positions_cached()
 
             synced = 0
+            # Open orders are fetched once per sync pass, on first need
+            open_orders: list[dict] | None = None
             for pos in positions:
-                if pos.get("symbol") != config.trading.SYMBOL:
-                    continue
-
                 position_amt = Decimal(pos.get("positionAmt", "0"))
                 entry_price = Decimal(pos.get("entryPrice", "0"))
 
@@ -1608,9 +2091,9 @@ class GridBot:
 
                 # Log when syncing position that doesn't match grid mode
                 # (Still place TP to protect the position)
-                if config.grid.GRID_SIDE == "LONG" and position_amt < 0:
+                if self.grid_side == "LONG" and position_amt < 0:
                     logger.info(f"📋 Syncing SHORT position in LONG mode (placing protective TP)")
-                elif config.grid.GRID_SIDE == "SHORT" and position_amt > 0:
+                elif self.grid_side == "SHORT" and position_amt > 0:
                     logger.info(f"📋 Syncing LONG position in SHORT mode (placing protective TP)")
 
                 position_qty = abs(position_amt)
@@ -1620,14 +2103,19 @@ class GridBot:
                     f"Qty: {position_qty} | Entry: ${entry_price:.4f}"
                 )
 
-                # Check if TP already exists for this position
                 # LONG position: TP is SELL order, SHORT position: TP is BUY order
-                tp_side_to_check = "SELL" if position_amt > 0 else "BUY"
-                open_orders = await self.client.get_open_orders(config.trading.SYMBOL)
+                side = PositionSide.LONG if position_amt > 0 else PositionSide.SHORT
+                tp_side = "SELL" if side is PositionSide.LONG else "BUY"
+
+                # Check if TP already exists for this position
+                if open_orders is None:
+                    open_orders = self.client.get_streamed_open_orders(self.symbol)
+                    if open_orders is None:
+                        open_orders = await self.client.get_open_orders(self.symbol)
                 has_tp = False
                 for order in open_orders:
                     # Check if there's a TP order for roughly this quantity
-                    if order.get("side") == tp_side_to_check:
+                    if order.get("side") == tp_side:
                         order_qty = Decimal(order.get("origQty", "0"))
                         if abs(order_qty - position_qty) < Decimal("0.01"):
                             has_tp = True
@@ -1643,15 +2131,11 @@ class GridBot:
                 tp_mode = "default"
 
                 # Determine position side for Trailing TP
-                position_side = "LONG" if position_amt > 0 else "SHORT"
+                position_side = side.name
 
                 # 1. Try Trailing TP (SuperTrend) first
                 if config.risk.USE_TRAILING_TP:
-                    candles = await self.client.get_klines(
-                        symbol=config.trading.SYMBOL,
-                        interval="1h",
-                        limit=100
-                    )
+                    candles = await self._get_candles(100)
                     if candles:
                         trailing_result = self.indicator_analyzer.get_trailing_tp(
                             candles=candles,
@@ -1685,18 +2169,14 @@ class GridBot:
                 # Calculate TP price from percent if not set by Trailing TP
                 if tp_price is None:
                     # LONG: TP above entry (SELL higher), SHORT: TP below entry (BUY lower)
-                    if position_amt > 0:
-                        tp_price = entry_price * (Decimal("1") + tp_percent / Decimal("100"))
-                    else:
-                        tp_price = entry_price * (Decimal("1") - tp_percent / Decimal("100"))
-                    tp_price = self._round_price(tp_price)
+                    tp_price = self._apply_tp(entry_price, tp_percent, side)
 
                 # Place TP order
-                client_order_id = f"sync_tp_{int(datetime.now().timestamp())}"
+                client_order_id = f"sync_tp_{next(self._coid_counter)}"
 
                 response = await self.client.place_order(
-                    symbol=config.trading.SYMBOL,
-                    side="SELL" if position_amt > 0 else "BUY",
+                    symbol=self.symbol,
+                    side=tp_side,
                     order_type="LIMIT",
                     quantity=position_qty,
                     price=tp_price,
@@ -1704,8 +2184,7 @@ class GridBot:
                 )
 
                 order_id = response.get("orderId")
-                tp_side = "SELL" if position_amt > 0 else "BUY"
-                tp_sign = "+" if position_amt > 0 else "-"
+                tp_sign = "+" if side is PositionSide.LONG else "-"
 
                 # Calculate TP distance for logging
                 if tp_percent is not None:
@@ -1720,7 +2199,7 @@ class GridBot:
                 )
 
                 # Send Telegram notification
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🔄 Synced Existing Position ({position_side})\n\n"
                     f"Avg Entry: ${entry_price:.4f}\n"
                     f"TP ({tp_side}): ${tp_price:.4f} ({tp_info})\n"
@@ -1749,6 +2228,68 @@ class GridBot:
     # RISK MANAGEMENT
     # =========================================================================
 
+    def _streamed_account_price(self) -> Decimal | None:
+        """
+        Current price from the kline stream, with unrealized PnL derived from it.
+
+        Balance and positions are kept current by ACCOUNT_UPDATE events, so
+        the circuit breaker needs no REST call while the user data and kline
+        streams are live. Returns None when any input may be stale.
+        """
+        now = time.monotonic()
+        if (
+            self._position_update_pending
+            or now - self._account_ts > ACCOUNT_STALE_SECONDS
+            or not self._klines_cache
+            or now - self._klines_ts > PRICE_STALE_SECONDS
+        ):
+            return None
+        positions = self.client.get_streamed_positions(self.symbol)
+        if positions is None:
+            return None
+
+        current_price = _D(self._klines_cache[-1][4])
+        unrealized_pnl = _D0
+        self._exchange_position_open = False
+        for position in positions:
+            position_amt = _D(position["positionAmt"])
+            if position_amt:
+                self._exchange_position_open = True
+                unrealized_pnl += position_amt * (current_price - _D(position["entryPrice"]))
+        self.state.unrealized_pnl = unrealized_pnl
+        return current_price
+
+    async def _fetch_account_state(self) -> Decimal:
+        """Refresh balance and unrealized PnL over REST; returns the mark price (0 if unknown)."""
+        balances, positions = await asyncio.gather(
+            self.client.get_account_balance(), self._get_position_snapshot()
+        )
+        current_price = _D0
+
+        # Find balance - use 'balance' (wallet balance) not 'availableBalance'
+        # availableBalance is reduced by margin locked for pending orders
+        for balance in balances:
+            if balance.get("asset") == self.margin_asset:
+                self.state.current_balance = Decimal(balance.get("balance", "0"))
+                self._last_balance_raw = None
+                break
+
+        self._exchange_position_open = any(
+            _D(position.get("positionAmt", "0")) for position in positions
+        )
+
+        # Get unrealized PnL and current price
+        for position in positions:
+            if position.get("symbol") == self.symbol:
+                self.state.unrealized_pnl = Decimal(position.get("unRealizedProfit", "0"))
+                mark_price = position.get("markPrice", "0")
+                if mark_price:
+                    current_price = Decimal(mark_price)
+                break
+
+        self._account_ts = time.monotonic()
+        return current_price
+
     async def check_circuit_breaker(self) -> bool:
         """
         Check if circuit breaker should trigger.
@@ -1762,27 +2303,25 @@ class GridBot:
         Returns:
             True if circuit breaker triggered (bot should stop)
         """
-        # Update current balance and PnL
+        # Flat on the exchange and no fill or account event since the last
+        # check: inputs can't have moved
+        if (
+            self._cb_flat_checked_at is not None
+            and self.state.positions_count == 0
+            and self.state.last_known_position_amt == 0
+            and self._breaker_state is BreakerState.CLOSED
+            and time.monotonic() - self._cb_flat_checked_at < CB_IDLE_SKIP_SECONDS
+        ):
+            return False
+
+        # Update current balance and PnL (pushed by the streams, REST when stale)
         try:
-            balances = await self.client.get_account_balance()
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
-            current_price = Decimal("0")
-
-            # Find balance - use 'balance' (wallet balance) not 'availableBalance'
-            # availableBalance is reduced by margin locked for pending orders
-            for balance in balances:
-                if balance.get("asset") == config.trading.MARGIN_ASSET:
-                    self.state.current_balance = Decimal(balance.get("balance", "0"))
-                    break
+            current_price = self._streamed_account_price()
+            if current_price is None:
+                current_price = await self._fetch_account_state()
 
-            # Get unrealized PnL and current price
-            for position in positions:
-                if position.get("symbol") == config.trading.SYMBOL:
-                    self.state.unrealized_pnl = Decimal(position.get("unRealizedProfit", "0"))
-                    mark_price = position.get("markPrice", "0")
-                    if mark_price:
-                        current_price = Decimal(mark_price)
-                    break
+            if current_price > 0:
+                self._record_price(current_price)
 
             # Update session high price for trailing stop
             if current_price > self.state.session_high_price:
@@ -1792,6 +2331,55 @@ class GridBot:
             logger.error(f"Error fetching balance/position: {e}")
             return False
 
+        # Grid levels don't cover every position (one kept through a re-grid or
+        # open at startup), so flat also requires the exchange to show none
+        flat = (
+            self.state.positions_count == 0
+            and not self._exchange_position_open
+            and self.state.last_known_position_amt == 0
+        )
+        self._cb_flat_checked_at = time.monotonic() if flat else None
+
+        # Skip re-evaluation when nothing the checks depend on has moved
+        # (quiet periods with no fills); this also avoids re-sending alerts
+        cb_inputs = (
+            self.state.current_balance,
+            self.state.unrealized_pnl,
+            self.state.daily_realized_pnl,
+            current_price,
+            self.state.positions_count,
+        )
+        if cb_inputs == self._last_cb_inputs:
+            return False
+        self._last_cb_inputs = cb_inputs
+
+        # Fast path: all four checks as plain comparisons against USDT limits;
+        # the percent figures and alert text are only built once one trips
+        state = self.state
+        limits = _risk_limits(
+            state.initial_balance,
+            config.risk.MAX_DRAWDOWN_PERCENT,
+            config.risk.DAILY_LOSS_LIMIT_PERCENT,
+        )
+        if limits is not None:
+            equity_floor, daily_loss_cap = limits
+            equity = state.current_balance + state.unrealized_pnl
+            trailing_stop = config.risk.TRAILING_STOP_PERCENT
+            high = state.session_high_price
+            if (
+                equity > equity_floor
+                and state.daily_realized_pnl + min(_D0, state.unrealized_pnl) > -daily_loss_cap
+                and equity >= config.risk.MIN_BALANCE_USDT
+                and (
+                    not trailing_stop
+                    or high <= 0
+                    or current_price <= 0
+                    or state.positions_count == 0
+                    or current_price * _D100 > high * (_D100 - trailing_stop)
+                )
+            ):
+                return await self._close_breaker()
+
         # Check 1: Max Drawdown
         drawdown = self.state.drawdown_percent
         if drawdown >= config.risk.MAX_DRAWDOWN_PERCENT:
@@ -1799,7 +2387,7 @@ class GridBot:
                 f"🚨 CIRCUIT BREAKER: Drawdown {drawdown:.2f}% >= "
                 f"MAX {config.risk.MAX_DRAWDOWN_PERCENT}%"
             )
-            await self.telegram.send_message(
+            self.telegram.queue_message(
                 f"🚨 *CIRCUIT BREAKER TRIGGERED*\n\n"
                 f"Reason: Max Drawdown\n"
                 f"Drawdown: {drawdown:.2f}%\n"
@@ -1808,21 +2396,25 @@ class GridBot:
             )
             return True
 
-        # Check 2: Daily Loss Limit (including unrealized losses)
+        # Check 2: Daily Loss Limit (including unrealized losses); skipped while
+        # the breaker is open, as the bot is already paused for the day
         daily_realized_loss = self.state.daily_loss_percent
         # Also consider unrealized losses as part of daily impact
-        daily_total_pnl = self.state.daily_realized_pnl + min(Decimal("0"), self.state.unrealized_pnl)
-        daily_total_loss = Decimal("0")
+        daily_total_pnl = self.state.daily_realized_pnl + min(_D0, self.state.unrealized_pnl)
+        daily_total_loss = _D0
         if self.state.initial_balance > 0 and daily_total_pnl < 0:
             daily_total_loss = abs(daily_total_pnl) / self.state.initial_balance * 100
         effective_daily_loss = max(daily_realized_loss, daily_total_loss)
-        if effective_daily_loss >= config.risk.DAILY_LOSS_LIMIT_PERCENT:
+        if (
+            self._breaker_state is not BreakerState.OPEN
+            and effective_daily_loss >= config.risk.DAILY_LOSS_LIMIT_PERCENT
+        ):
             logger.critical(
                 f"🚨 DAILY LOSS LIMIT: Loss {effective_daily_loss:.2f}% >= "
                 f"LIMIT {config.risk.DAILY_LOSS_LIMIT_PERCENT}% "
                 f"(realized={daily_realized_loss:.2f}%, unrealized={self.state.unrealized_pnl:.2f})"
             )
-            await self.telegram.send_message(
+            self.telegram.queue_message(
                 f"🚨 *DAILY LOSS LIMIT REACHED*\n\n"
                 f"Effective Daily Loss: {effective_daily_loss:.2f}%\n"
                 f"Realized: {daily_realized_loss:.2f}%\n"
@@ -1831,6 +2423,7 @@ class GridBot:
                 f"Bot pausing until tomorrow."
             )
             # Pause instead of full stop for daily limit
+            self._breaker_state = BreakerState.OPEN
             await self.pause()
             return False  # Don't trigger full shutdown
 
@@ -1850,7 +2443,7 @@ class GridBot:
                     f"🚨 TRAILING STOP: Price dropped {drop_from_high:.2f}% from high "
                     f"${self.state.session_high_price:.2f}"
                 )
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"🚨 *TRAILING STOP TRIGGERED*\n\n"
                     f"Session High: ${self.state.session_high_price:.2f}\n"
                     f"Current: ${current_price:.2f}\n"
@@ -1870,7 +2463,7 @@ class GridBot:
                 f"MIN {config.risk.MIN_BALANCE_USDT} "
                 f"(balance={self.state.current_balance:.2f}, uPnL={self.state.unrealized_pnl:.2f})"
             )
-            await self.telegram.send_message(
+            self.telegram.queue_message(
                 f"🚨 *MINIMUM BALANCE REACHED*\n\n"
                 f"Equity: {current_equity:.2f}\n"
                 f"Balance: {self.state.current_balance:.2f}\n"
@@ -1880,6 +2473,19 @@ class GridBot:
             )
             return True
 
+        return await self._close_breaker()
+
+    async def _close_breaker(self) -> bool:
+        """
+        Record an all-clear circuit breaker check.
+
+        A half-open breaker (daily window just reset) closes on its first
+        clear check and trading resumes. Returns False (no shutdown).
+        """
+        if self._breaker_state is BreakerState.HALF_OPEN:
+            self._breaker_state = BreakerState.CLOSED
+            logger.info("Circuit breaker closed - daily loss back within limit")
+            await self.resume()
         return False
     
     async def emergency_shutdown(self) -> None:
@@ -1924,7 +2530,7 @@ class GridBot:
         logger.warning("⏸️ BOT PAUSED - No new orders will be placed")
         self.bot_state = BotState.PAUSED
         
-        await self.telegram.send_message(
+        self.telegram.queue_message(
             "⏸️ Bot Paused\n\n"
             "Existing orders remain active.\n"
             "Use /resume to restart operations."
@@ -1940,8 +2546,10 @@ class GridBot:
 
         logger.info("▶️ BOT RESUMED - Normal operations restored")
         self.bot_state = BotState.RUNNING
+        # A manual resume re-arms the daily-loss check
+        self._breaker_state = BreakerState.CLOSED
 
-        await self.telegram.send_message(
+        self.telegram.queue_message(
             "▶️ Bot Resumed\n\n"
             "Normal operations restored."
         )
@@ -1961,35 +2569,50 @@ class GridBot:
         logger.warning("⏸️ PAUSE BUYING - Cancelling BUY orders only, keeping TP orders")
 
         try:
-            # Get all open orders
-            open_orders = await self.client.get_open_orders(config.trading.SYMBOL)
+            # Get all open orders (from the user data stream when it is live)
+            open_orders = self.client.get_streamed_open_orders(self.symbol)
+            if open_orders is None:
+                open_orders = await self.client.get_open_orders(self.symbol)
 
             cancelled_count = 0
-            kept_count = 0
 
-            for order in open_orders:
-                order_side = order.get("side", "")
-                order_id = order.get("orderId")
-
-                # Only cancel BUY orders
-                if order_side == "BUY" and order_id:
-                    try:
-                        await self.client.cancel_order(
-                            symbol=config.trading.SYMBOL,
-                            order_id=order_id
-                        )
-                        cancelled_count += 1
+            # Only cancel BUY orders
+            buy_order_ids = [
+                order["orderId"] for order in open_orders
+                if order.get("side", "") == "BUY" and order.get("orderId")
+            ]
+            kept_count = len(open_orders) - len(buy_order_ids)
 
-                        # Update grid level state
-                        level = self.state.get_level_by_order_id(order_id)
-                        if level:
-                            level.order_id = None
-                            level.state = GridLevelState.EMPTY
+            # One signed request per MAX_BATCH_CANCELS orders, all in flight together
+            batch_size = self.client.MAX_BATCH_CANCELS
+            batches = [
+                buy_order_ids[start:start + batch_size]
+                for start in range(0, len(buy_order_ids), batch_size)
+            ]
+            results = await asyncio.gather(
+                *(self.client.cancel_batch_orders(self.symbol, batch) for batch in batches),
+                return_exceptions=True,
+            )
 
-                    except Exception as e:
-                        logger.error(f"Failed to cancel BUY order {order_id}: {e}")
-                else:
-                    kept_count += 1
+            for batch, responses in zip(batches, results):
+                if isinstance(responses, Exception):
+                    logger.error(f"Failed to cancel BUY orders {batch}: {responses}")
+                    continue
+
+                for order_id, response in zip(batch, responses):
+                    if "code" in response and "orderId" not in response:
+                        logger.error(
+                            f"Failed to cancel BUY order {order_id}: "
+                            f"Error {response.get('code')}: {response.get('msg')}"
+                        )
+                        continue
+                    cancelled_count += 1
+
+                    # Update grid level state
+                    level = self.state.get_level_by_order_id(order_id)
+                    if level:
+                        level.set_order_id(None)
+                        level.set_state(GridLevelState.EMPTY)
 
             logger.info(f"Pause buying complete: cancelled {cancelled_count} BUY orders, kept {kept_count} TP orders")
 
@@ -1999,6 +2622,11 @@ class GridBot:
         except Exception as e:
             logger.error(f"Error during pause_buying: {e}")
 
+    def _set_grid_side(self, side: str) -> None:
+        """Change the grid direction, keeping the runtime config in step for other modules."""
+        self.grid_side = side
+        config.grid.GRID_SIDE = side
+
     async def _smart_startup_side_check(self) -> None:
         """
         Smart startup: Determine optimal grid side from market analysis.
@@ -2013,17 +2641,20 @@ class GridBot:
         logger.info("🔍 Smart Startup: Determining optimal grid side from analysis...")
 
         try:
-            # Run market analysis
-            analysis = await self.strategy_manager.analyze_market(config.trading.SYMBOL)
+            # Market analysis and the position query are independent, so overlap them
+            analysis, positions = await asyncio.gather(
+                self.strategy_manager.analyze_market(self.symbol),
+                self.client.get_position_risk(self.symbol),
+            )
             trend_score = self.strategy_manager.current_trend_score
 
             if not trend_score:
                 logger.warning("Smart Startup: No trend score available, using config fallback")
-                logger.info(f"Smart Startup: Grid side = {config.grid.GRID_SIDE} (from config)")
+                logger.info(f"Smart Startup: Grid side = {self.grid_side} (from config)")
                 return
 
             # Determine optimal side from analysis
-            config_side = config.grid.GRID_SIDE  # Fallback only
+            config_side = self.grid_side  # Fallback only
             analysis_side = trend_score.recommended_side
 
             logger.info(
@@ -2037,7 +2668,7 @@ class GridBot:
                 self._waiting_for_clear_signal = True
                 logger.info(f"Smart Startup: Analysis unclear (score={trend_score.total}), waiting for clear signal...")
                 logger.info("Smart Startup: ⏸️ No orders will be placed until trend is clear (score ≥+2 or ≤-2)")
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"⏸️ Waiting for Clear Signal\n\n"
                     f"Trend Score: {trend_score.total:+d} (unclear)\n"
                     f"EMA:{trend_score.ema_score:+d} MACD:{trend_score.macd_score:+d} "
@@ -2050,11 +2681,10 @@ class GridBot:
                 logger.info(f"Smart Startup: Analysis recommends {optimal_side}")
 
             # Check for existing positions that might force a different side
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
-            position_amt = Decimal("0")
+            position_amt = _D0
 
             for pos in positions:
-                if pos.get("symbol") == config.trading.SYMBOL:
+                if pos.get("symbol") == self.symbol:
                     position_amt = Decimal(pos.get("positionAmt", "0"))
                     break
 
@@ -2077,9 +2707,9 @@ class GridBot:
                 optimal_side = "SHORT"
 
             # Set the grid side
-            config.grid.GRID_SIDE = optimal_side
+            self._set_grid_side(optimal_side)
 
-            await self.telegram.send_message(
+            self.telegram.queue_message(
                 f"🚀 Dynamic Grid Initialization\n\n"
                 f"Grid Side: {optimal_side}\n"
                 f"Trend Score: {trend_score.total:+d}\n"
@@ -2091,7 +2721,7 @@ class GridBot:
 
         except Exception as e:
             logger.error(f"Smart Startup check failed: {e}")
-            logger.info(f"Falling back to config grid side: {config.grid.GRID_SIDE}")
+            logger.info(f"Falling back to config grid side: {self.grid_side}")
 
     async def _can_force_switch(
         self,
@@ -2131,9 +2761,9 @@ class GridBot:
         unrealized_pnl = Decimal(str(pos.get("unrealizedProfit", "0")))
         position_value = entry_price * position_amt
         if position_value > 0:
-            loss_percent = abs(min(Decimal("0"), unrealized_pnl)) / position_value * 100
+            loss_percent = abs(min(_D0, unrealized_pnl)) / position_value * 100
         else:
-            loss_percent = Decimal("0")
+            loss_percent = _D0
 
         max_loss = config.grid.FORCE_SWITCH_MAX_LOSS_PERCENT
         if loss_percent > max_loss:
@@ -2174,15 +2804,16 @@ class GridBot:
         - TP order status if exists
         - Unrealized PnL
         - Options for user
-        """
-        symbol = config.trading.SYMBOL
 
-        # Get unrealized PnL from position data
-        unrealized_pnl = Decimal(str(pos.get("unrealizedProfit", 0)))
+        Open orders are read from the user data stream, falling back to REST.
+        """
+        symbol = self.symbol
 
-        # Calculate PnL percentage
-        position_value = entry_price * position_amt
-        pnl_percent = (unrealized_pnl / position_value * 100) if position_value > 0 else Decimal(0)
+        # Display-only figures, so plain float math is enough
+        entry = float(entry_price)
+        unrealized_pnl = float(pos.get("unrealizedProfit", 0))
+        position_value = entry * float(position_amt)
+        pnl_percent = (unrealized_pnl / position_value * 100.0) if position_value > 0 else 0.0
 
         # Get trend score if available
         trend_score_str = "N/A"
@@ -2193,14 +2824,16 @@ class GridBot:
         # Get TP order info
         tp_info = "No TP order found ⚠️"
         try:
-            open_orders = await self.client.get_open_orders(symbol)
+            open_orders = self.client.get_streamed_open_orders(symbol)
+            if open_orders is None:
+                open_orders = await self.client.get_open_orders(symbol)
             tp_side = "SELL" if pos_side == "LONG" else "BUY"
 
             for order in open_orders:
                 if order.get("side") == tp_side:
-                    tp_price = Decimal(str(order.get("price", 0)))
-                    if entry_price > 0:
-                        tp_percent = ((tp_price - entry_price) / entry_price * 100)
+                    tp_price = float(order.get("price", 0))
+                    if entry > 0:
+                        tp_percent = (tp_price - entry) / entry * 100.0
                         tp_info = f"TP @ ${tp_price:.2f} ({tp_percent:+.2f}%)"
                     else:
                         tp_info = f"TP @ ${tp_price:.2f}"
@@ -2226,7 +2859,7 @@ class GridBot:
             f"• Manually close position on Aster DEX if urgent"
         )
 
-        await self.telegram.send_message(alert_msg)
+        self.telegram.queue_message(alert_msg)
 
     async def switch_grid_side(self, new_side: str) -> None:
         """
@@ -2235,16 +2868,15 @@ class GridBot:
         Called by StrategyManager when trend score confirms new direction.
 
         Process:
-        1. Cancel all existing orders
-        2. Update GRID_SIDE in runtime config
-        3. Get current price
-        4. Recalculate grid levels
-        5. Place new orders
+        1. Update GRID_SIDE in runtime config
+        2. Cancel all existing orders while fetching price and grid range
+        3. Recalculate grid levels
+        4. Place new orders
 
         Args:
             new_side: "LONG", "SHORT", or "BOTH"
         """
-        old_side = config.grid.GRID_SIDE
+        old_side = self.grid_side
 
         if old_side == new_side:
             logger.info(f"Already on {new_side} side, no switch needed")
@@ -2254,9 +2886,9 @@ class GridBot:
         # Switching while holding position causes realized losses
         # UNLESS force-switch conditions are met (strong reversal + BTC alignment)
         try:
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
+            positions = await self.client.get_position_risk(self.symbol)
             for pos in positions:
-                if pos.get("symbol") == config.trading.SYMBOL:
+                if pos.get("symbol") == self.symbol:
                     position_amt = Decimal(pos.get("positionAmt", "0"))
                     entry_price = Decimal(pos.get("entryPrice", "0"))
 
@@ -2283,8 +2915,8 @@ class GridBot:
                                 )
                                 close_result = await self.close_all_positions()
                                 if close_result.get("success"):
-                                    pnl = close_result.get("realized_pnl", Decimal("0"))
-                                    await self.telegram.send_message(
+                                    pnl = close_result.get("realized_pnl", _D0)
+                                    self.telegram.queue_message(
                                         f"🔄 Force Switch: Closed {pos_side} position\n"
                                         f"Realized PnL: ${pnl:+.2f}\n"
                                         f"Reason: Strong reversal confirmed\n"
@@ -2322,28 +2954,21 @@ class GridBot:
         logger.warning(f"🔄 SWITCHING GRID SIDE: {old_side} → {new_side}")
 
         try:
-            # 1. Cancel all existing orders
-            await self.cancel_all_orders()
-            logger.info("All orders canceled for side switch")
-            
-            # 2. Update runtime config (note: this doesn't persist to .env file)
+            # 1. Update runtime config (note: this doesn't persist to .env file)
             # We modify the config object directly
-            config.grid.GRID_SIDE = new_side
+            self._set_grid_side(new_side)
             logger.info(f"Grid side updated to: {new_side}")
-            
-            # 3. Get current price
-            ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-            current_price = Decimal(ticker["price"])
-            logger.info(f"Current price for new grid: ${current_price:.4f}")
 
-            # 4. Calculate dynamic grid range
-            grid_range = await self.get_dynamic_grid_range(current_price)
+            # 2. Cancel all existing orders; ticker and ATR don't depend on it
+            current_price, grid_range = await self._cancel_and_price_grid()
+            logger.info("All orders canceled for side switch")
+            logger.info(f"Current price for new grid: ${current_price:.4f}")
 
-            # 5. Recalculate grid levels
-            self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+            # 3. Recalculate grid levels
+            self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
             self.state.entry_price = current_price
 
-            # 6. Place new orders
+            # 4. Place new orders
             await self.place_grid_orders()
 
             logger.info(
@@ -2363,8 +2988,8 @@ class GridBot:
         except Exception as e:
             logger.error(f"Side switch failed: {e}")
             # Attempt to restore old side on failure
-            config.grid.GRID_SIDE = old_side
-            await self.telegram.send_message(
+            self._set_grid_side(old_side)
+            self.telegram.queue_message(
                 f"❌ Side Switch Failed!\n\n"
                 f"Error: {e}\n"
                 f"Keeping current side: {old_side}"
@@ -2374,6 +2999,102 @@ class GridBot:
     # EVENT HANDLERS
     # =========================================================================
     
+    async def _get_positions_cached(self) -> list[dict]:
+        """
+        Position risk for the trading symbol without a round-trip where possible.
+
+        Reads the positions the user data stream keeps current while it is
+        connected, unless a fill's position update is still outstanding.
+        Otherwise a REST snapshot is reused for POSITION_CACHE_TTL
+        seconds; order and position updates invalidate it, so a cached read
+        never predates a fill the bot has already seen.
+        """
+        if not self._position_update_pending:
+            streamed = self.client.get_streamed_positions(self.symbol)
+            if streamed is not None:
+                return streamed
+        return await self._get_position_snapshot()
+
+    async def _get_position_snapshot(self) -> list[dict]:
+        """
+        REST position risk for the trading symbol (with markPrice).
+
+        Shared for POSITION_CACHE_TTL seconds between the fill path and the
+        circuit breaker; fills invalidate it. A response is not cached if a
+        fill or position update arrived while the request was in flight,
+        since it may show the position from before that fill.
+        """
+        cached = self._position_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] <= POSITION_CACHE_TTL:
+            return cached[1]
+        generation = self._position_generation
+        positions = await self.client.get_position_risk(self.symbol)
+        if generation == self._position_generation:
+            self._position_cache = (now, positions)
+        return positions
+
+    async def _get_candles(self, limit: int) -> list[list]:
+        """
+        Most recent `limit` 1h candles for TP indicators.
+
+        Served from the kline stream cache while it is live and deep enough,
+        so the fill path needs no REST round-trip; otherwise fetched over REST.
+        """
+        cache = self._klines_cache
+        if len(cache) >= limit and time.monotonic() - self._klines_ts <= KLINE_STALE_SECONDS:
+            return list(cache)[-limit:]
+        return await self.client.get_klines(
+            symbol=self.symbol,
+            interval="1h",
+            limit=limit
+        )
+
+    def on_kline_update(self, stream: str, data: dict) -> None:
+        """Fold a 1h kline stream event into the candle cache."""
+        k = data.get("k")
+        if not k:
+            return
+        # Same layout as a REST kline row
+        row = [
+            k["t"], k["o"], k["h"], k["l"], k["c"], k["v"], k["T"],
+            k.get("q", "0"), k.get("n", 0), k.get("V", "0"), k.get("Q", "0"), "0",
+        ]
+        cache = self._klines_cache
+        if cache and cache[-1][0] == row[0]:
+            cache[-1] = row  # Update to the open candle
+        elif not cache or row[0] > cache[-1][0]:
+            cache.append(row)  # New candle
+        self._klines_ts = time.monotonic()
+
+    def _record_price(self, price: Decimal) -> None:
+        """Cache the latest observed market price for the periodic monitors."""
+        self.state.last_price = price
+        self.state.last_price_ts = time.monotonic()
+
+    async def _get_current_price(self, max_age: float = LIVE_PRICE_MAX_AGE) -> Decimal:
+        """
+        Latest market price without a REST call when the streams have one.
+
+        Uses whichever is newer of the kline stream's close and the last
+        recorded fill/mark price, provided it is at most max_age seconds old;
+        otherwise fetches the ticker over REST and records it.
+        """
+        now = time.monotonic()
+        state = self.state
+        if self._klines_cache and now - self._klines_ts <= max_age and (
+            self._klines_ts >= state.last_price_ts or state.last_price <= 0
+        ):
+            return _D(self._klines_cache[-1][4])
+        if state.last_price > 0 and now - state.last_price_ts <= max_age:
+            return state.last_price
+
+        ticker = await self.client.get_ticker_price(self.symbol)
+        price = Decimal(str(ticker.get("price", 0)))
+        if price > 0:
+            self._record_price(price)
+        return price
+
     def on_order_update(self, order_data: dict) -> None:
         """
         Handle order update from WebSocket.
@@ -2384,29 +3105,41 @@ class GridBot:
         - FILLED: Complete fill
         - CANCELED: Order canceled
         - EXPIRED: Order expired
+
+        Prices and quantities that reach position state, PnL or orders are
+        parsed as Decimal; figures that only filter or annotate (slippage,
+        the partial-fill notional check) use float.
         
         Args:
             order_data: Order update payload from WebSocket
         """
-        order_id = order_data.get("i")  # orderId
-        status = order_data.get("X")    # order status
-        side = order_data.get("S")      # BUY/SELL
-        price = order_data.get("p")     # price
-        exec_qty = order_data.get("l")  # last executed quantity
+        # orderId, order status, BUY/SELL, price, last executed quantity
+        order_id, status, side, price, exec_qty = _order_update_fields(order_data)
         
-        logger.debug(f"Order update: {order_id} {status} {side} @ {price}")
+        logger.debug("Order update: %s %s %s @ %s", order_id, status, side, price)
         
         if status in ("FILLED", "PARTIALLY_FILLED"):
+            self._position_cache = None
+            self._position_generation += 1
+            self._position_update_pending = True
+            self._cb_flat_checked_at = None
+            last_fill_price = order_data.get("L")
+            if last_fill_price:
+                self._record_price(_D(last_fill_price))
+
             # Find the grid level for this order
             level = self.state.get_level_by_order_id(order_id)
 
             if level and status == "FILLED":
-                fill_price = Decimal(price or "0")
-                fill_qty = Decimal(exec_qty or "0")
+                fill_price = _D(price)
+                fill_qty = _D(exec_qty)
 
                 # Calculate slippage
                 slippage = level.calculate_slippage(fill_price)
-                slippage_info = f" | Slippage: {slippage:+.3f}%" if slippage != 0 else ""
+                slippage_info = (
+                    f" | Slippage: {slippage:+.3f}%"
+                    if slippage != 0 and logger.isEnabledFor(logging.INFO) else ""
+                )
 
                 # Update position tracking based on side
                 if side == "BUY":
@@ -2422,14 +3155,14 @@ class GridBot:
                     else:
                         # Clean full fill
                         level.entry_price = fill_price
-                        level.position_quantity = fill_qty
+                        level.set_position_quantity(fill_qty)
                         level.actual_fill_price = fill_price
-                        level.state = GridLevelState.POSITION_HELD
+                        level.set_state(GridLevelState.POSITION_HELD)
                         logger.info(
                             f"Order FILLED: BUY @ {price} | Level {level.index} | "
                             f"Position: {fill_qty} @ {fill_price}{slippage_info}"
                         )
-                    pnl = Decimal("0")
+                    pnl = _D0
 
                 elif side == "SELL" and level.entry_price > 0:
                     # SELL (TP) filled: calculate realized PnL
@@ -2444,39 +3177,24 @@ class GridBot:
                     )
 
                     # Log TP outcome for ML analysis
-                    time_to_fill = 0.0
-                    if level.tp_placed_at:
-                        time_to_fill = (datetime.now() - level.tp_placed_at).total_seconds()
-                    trade_event_logger.log_tp_filled(
-                        entry_price=level.entry_price,
-                        tp_target_price=level.tp_target_price if level.tp_target_price > 0 else fill_price,
-                        actual_fill_price=fill_price,
-                        quantity=level.position_quantity,
-                        realized_pnl=pnl,
-                        time_to_fill_seconds=time_to_fill,
-                        grid_level=level.index,
-                        slippage_percent=float(slippage),
-                        order_id=str(order_id),
-                    )
+                    if self._telemetry_enabled:
+                        self._log_tp_outcome(level, fill_price, pnl, slippage, order_id)
                 else:
-                    pnl = Decimal("0")
+                    pnl = _D0
                     logger.info(f"Order FILLED: {side} @ {price} | Level {level.index}{slippage_info}")
 
-                # Schedule rebalancing (can't await in callback)
-                asyncio.create_task(self.rebalance_on_fill(level, fill_price, fill_qty))
-
-                # Log trade and send telegram notification
-                asyncio.create_task(self._log_and_notify_fill(
-                    side, price, exec_qty, level.index, pnl, slippage
-                ))
+                # Rebalance, then log and notify, from the fill worker (can't await in callback)
+                self._fill_events.put_nowait(
+                    ("FILLED", level, side, fill_price, fill_qty, price, exec_qty, pnl, slippage)
+                )
             
             elif status == "PARTIALLY_FILLED":
-                exec_qty_decimal = Decimal(exec_qty or "0")
-                price_decimal = Decimal(price or "0")
-                notional = exec_qty_decimal * price_decimal
+                notional = float(exec_qty or 0) * float(price or 0)
 
                 # Only handle partial fill if significant enough (> min_notional)
-                if notional >= self.min_notional and level:
+                if notional >= self._min_notional_f and level:
+                    exec_qty_decimal = _D(exec_qty)
+                    price_decimal = _D(price)
                     # Track partial fill in level (accumulate position)
                     if side == "BUY":
                         level.add_partial_fill(price_decimal, exec_qty_decimal)
@@ -2487,19 +3205,60 @@ class GridBot:
                         f"({level.partial_fill_count} fills)"
                     )
 
-                    # Log trade for this partial fill
-                    asyncio.create_task(self._log_and_notify_fill(
-                        side, price, exec_qty, level.index, Decimal("0"), Decimal("0"),
-                        is_partial=True
-                    ))
-
-                    # Schedule a partial rebalance to place TP for filled portion
-                    asyncio.create_task(self._handle_partial_fill(
-                        level, side, price_decimal, exec_qty_decimal
-                    ))
+                    # Place TP for the filled portion, then log the partial fill
+                    self._fill_events.put_nowait(
+                        ("PARTIAL", level, side, price_decimal, exec_qty_decimal, price, exec_qty)
+                    )
                 else:
                     logger.info(f"Partial fill too small ({notional:.2f} < {self.min_notional}), skipping")
     
+    def _log_tp_outcome(
+        self, level: GridLevel, fill_price: Decimal, pnl: Decimal, slippage: float, order_id: int
+    ) -> None:
+        """Record a TP fill (target vs actual, time to fill) in the ML event log."""
+        time_to_fill = 0.0
+        if level.tp_placed_at is not None:
+            time_to_fill = time.monotonic() - level.tp_placed_at
+        trade_event_logger.log_tp_filled(
+            entry_price=level.entry_price,
+            tp_target_price=level.tp_target_price if level.tp_target_price > 0 else fill_price,
+            actual_fill_price=fill_price,
+            quantity=level.position_quantity,
+            realized_pnl=pnl,
+            time_to_fill_seconds=time_to_fill,
+            grid_level=level.index,
+            slippage_percent=slippage,
+            order_id=str(order_id),
+        )
+
+    async def _fill_worker(self) -> None:
+        """
+        Apply queued fills one at a time, in the order the stream reported them.
+
+        The order-affecting work (rebalance / partial TP) runs first and the
+        trade log and notification after it, so bookkeeping never delays
+        the next order.
+        """
+        events = self._fill_events
+        while True:
+            event = await events.get()
+            try:
+                if event[0] == "FILLED":
+                    _, level, side, fill_price, fill_qty, price, exec_qty, pnl, slippage = event
+                    await self.rebalance_on_fill(level, fill_price, fill_qty)
+                    await self._log_and_notify_fill(
+                        side, price, exec_qty, level.index, pnl, slippage
+                    )
+                else:
+                    _, level, side, fill_price, fill_qty, price, exec_qty = event
+                    await self._handle_partial_fill(level, side, fill_price, fill_qty)
+                    await self._log_and_notify_fill(
+                        side, price, exec_qty, level.index, _D0, 0.0,
+                        is_partial=True
+                    )
+            except Exception as e:
+                logger.error(f"Error processing {event[0]} fill: {e}")
+
     def on_position_update(self, position_data: dict) -> None:
         """
         Handle position update from WebSocket.
@@ -2508,11 +3267,16 @@ class GridBot:
         and resets grid levels accordingly.
         """
         symbol = position_data.get("s")
-        if symbol != config.trading.SYMBOL:
+        if symbol != self.symbol:
             return
 
-        position_amt = Decimal(position_data.get("pa", "0"))
-        entry_price = Decimal(position_data.get("ep", "0"))
+        self._position_cache = None
+        self._position_generation += 1
+        self._position_update_pending = False
+        self._cb_flat_checked_at = None
+        self._account_ts = time.monotonic()
+        # Both feed Decimal risk state; entry price is only logged, so left as text
+        position_amt = _D(position_data.get("pa", "0"))
         unrealized_pnl = Decimal(position_data.get("up", "0"))
 
         self.state.unrealized_pnl = unrealized_pnl
@@ -2525,14 +3289,14 @@ class GridBot:
                 f"Previous: {last_known} → Current: 0"
             )
             # Schedule grid reset (can't await in callback)
-            asyncio.create_task(self._handle_external_position_close())
+            self._spawn(self._handle_external_position_close())
 
         # Update last known position amount
         self.state.last_known_position_amt = position_amt
 
         logger.debug(
-            f"Position: {position_amt} @ {entry_price:.4f} | "
-            f"uPnL: {unrealized_pnl:.4f}"
+            "Position: %s @ %s | uPnL: %s",
+            position_amt, position_data.get("ep", "0"), unrealized_pnl,
         )
 
     async def _handle_external_position_close(self) -> None:
@@ -2540,14 +3304,29 @@ class GridBot:
         Handle external position close (manual close on exchange).
 
         Resets grid levels that were holding positions and optionally
-        re-places buy orders to reach max orders limit.
+        re-places buy orders to reach max orders limit. Triggers that arrive
+        while a run is in flight are coalesced into a single follow-up run.
+        """
+        if self._ext_close_lock.locked():
+            self._ext_close_pending = True
+            return
+        async with self._ext_close_lock:
+            while True:
+                self._ext_close_pending = False
+                await self._reset_after_external_close()
+                if not self._ext_close_pending:
+                    break
+
+    async def _reset_after_external_close(self) -> None:
+        """
+        Reset held levels after an external close, then refill orders.
+
+        The ACCOUNT_UPDATE that reported the zero position is itself the
+        sign the exchange has settled, so orders are refilled right away.
         """
         try:
             # Count levels that need to be reset
-            levels_to_reset = [
-                level for level in self.state.levels
-                if level.state in (GridLevelState.POSITION_HELD, GridLevelState.TP_PLACED)
-            ]
+            levels_to_reset = self.state.get_levels_with_position()
 
             if not levels_to_reset:
                 logger.info("No grid levels to reset after external close")
@@ -2560,7 +3339,7 @@ class GridBot:
                 level.reset()
 
             # Notify via Telegram
-            await self.telegram.send_message(
+            self.telegram.queue_message(
                 f"🔄 *External Position Close Detected*\n\n"
                 f"Positions closed: `{len(levels_to_reset)}`\n"
                 f"Grid levels reset to EMPTY\n\n"
@@ -2569,7 +3348,6 @@ class GridBot:
 
             # Trigger a re-check to place new orders
             # This ensures bot reaches max order limit
-            await asyncio.sleep(2)  # Brief delay for exchange to update
             await self._ensure_max_orders()
 
         except Exception as e:
@@ -2583,66 +3361,72 @@ class GridBot:
         """
         try:
             # Count current active orders
-            active_orders = sum(1 for level in self.state.levels if level.order_id is not None)
+            active_orders = self.state.active_orders_count
             max_orders = config.grid.MAX_OPEN_ORDERS
 
             if active_orders >= max_orders:
-                logger.debug(f"Already at max orders: {active_orders}/{max_orders}")
+                logger.debug("Already at max orders: %s/%s", active_orders, max_orders)
                 return
 
             # Get current price
-            ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-            current_price = Decimal(ticker["price"])
+            current_price = await self._get_current_price()
 
             # Find empty levels that should have orders
             empty_levels = [
-                level for level in self.state.levels
-                if level.state == GridLevelState.EMPTY and level.order_id is None
+                level for level in self.state.get_levels_in_state(GridLevelState.EMPTY)
+                if level.order_id is None
             ]
 
-            # Sort by distance to current price (closest first)
-            empty_levels.sort(key=lambda l: abs(l.price - current_price))
-
             orders_to_place = min(len(empty_levels), max_orders - active_orders)
 
             if orders_to_place <= 0:
                 return
 
+            # Only the closest few are needed, so select them without a full sort
+            empty_levels = heapq.nsmallest(
+                orders_to_place, empty_levels, key=lambda l: abs(l.price - current_price)
+            )
+
             logger.info(f"Placing {orders_to_place} new orders after external close")
 
+            # Determine side based on grid configuration: a LONG grid buys
+            # below current price, a SHORT grid sells above it
+            side = "BUY" if self.grid_side == "LONG" else "SELL"
+            selected = [
+                level for level in empty_levels
+                if (level.price < current_price if side == "BUY" else level.price > current_price)
+            ]
+
+            # Place them concurrently (at most MAX_OPEN_ORDERS) so the refill
+            # costs about one round-trip while the price ranking still holds
+            results = await asyncio.gather(
+                *(self._place_grid_order(level, side) for level in selected),
+                return_exceptions=True,
+            )
             placed = 0
-            for level in empty_levels[:orders_to_place]:
-                try:
-                    # Determine side based on grid configuration
-                    if config.grid.GRID_SIDE == "LONG":
-                        # For LONG grid, buy below current price
-                        if level.price < current_price:
-                            await self._place_grid_order(level, "BUY")
-                            placed += 1
-                    else:
-                        # For SHORT grid, sell above current price
-                        if level.price > current_price:
-                            await self._place_grid_order(level, "SELL")
-                            placed += 1
-                except Exception as e:
-                    logger.warning(f"Failed to place order at level {level.index}: {e}")
+            for level, result in zip(selected, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to place order at level {level.index}: {result}")
+                elif level.order_id is not None:
+                    placed += 1
 
             if placed > 0:
                 logger.info(f"Placed {placed} new orders")
                 # Find price range of placed orders
                 placed_levels = [
-                    level for level in self.state.levels
-                    if level.order_id is not None and level.state in (GridLevelState.BUY_PLACED, GridLevelState.SELL_PLACED)
+                    level for level in self.state.get_levels_in_state(
+                        GridLevelState.BUY_PLACED, GridLevelState.SELL_PLACED
+                    )
+                    if level.order_id is not None
                 ]
                 if placed_levels:
                     prices = [level.price for level in placed_levels]
                     price_range = (min(prices), max(prices))
-                    side = "BUY" if config.grid.GRID_SIDE == "LONG" else "SELL"
                     await self.telegram.send_orders_placed(
                         orders_count=placed,
                         side=side,
                         price_range=price_range,
-                        grid_side=config.grid.GRID_SIDE,
+                        grid_side=self.grid_side,
                     )
 
         except Exception as e:
@@ -2651,15 +3435,22 @@ class GridBot:
     def on_balance_update(self, balance_data: dict) -> None:
         """Handle balance update from WebSocket."""
         asset = balance_data.get("a")
-        if asset != config.trading.MARGIN_ASSET:
+        if asset != self.margin_asset:
             return
         
-        wallet_balance = Decimal(balance_data.get("wb", "0"))
-        cross_wallet = Decimal(balance_data.get("cw", "0"))
-        
+        # Any event proves the stream is live, but an unchanged wallet balance
+        # (re-sent alongside unrelated updates) needs no Decimal parse
+        self._account_ts = time.monotonic()
+        raw_wallet = balance_data.get("wb", "0")
+        if raw_wallet == self._last_balance_raw:
+            return
+        self._last_balance_raw = raw_wallet
+
+        wallet_balance = Decimal(raw_wallet)
         self.state.current_balance = wallet_balance
+        self._cb_flat_checked_at = None
         
-        logger.debug(f"Balance: {asset} = {wallet_balance:.4f}")
+        logger.debug("Balance: %s = %.4f", asset, wallet_balance)
     
     async def _log_and_notify_fill(
         self,
@@ -2667,16 +3458,21 @@ class GridBot:
         price: str,
         quantity: str,
         grid_level: int,
-        pnl: Decimal = Decimal("0"),
-        slippage: Decimal = Decimal("0"),
+        pnl: Decimal = _D0,
+        slippage: float = 0.0,
         is_partial: bool = False
     ) -> None:
-        """Log trade to database and send Telegram notification."""
+        """
+        Log trade to database and queue the Telegram notification.
+
+        Telegram messages are sent by their own background worker, so a
+        fill never waits on the HTTPS POST.
+        """
         try:
             # Log to SQLite with PnL
             status = "PARTIALLY_FILLED" if is_partial else "FILLED"
             trade = create_trade_record(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 side=side,
                 order_type="LIMIT",
                 price=Decimal(price),
@@ -2690,26 +3486,27 @@ class GridBot:
             await self.trade_logger.log_trade(trade)
 
             # Build slippage info if significant
-            slippage_str = f"\n📉 Slippage: `{slippage:+.3f}%`" if abs(slippage) > Decimal("0.01") else ""
+            slippage_str = f"\n📉 Slippage: `{slippage:+.3f}%`" if abs(slippage) > 0.01 else ""
 
             # Send Telegram alert with PnL info for SELL orders
+            # (display only, so formatted from floats rather than Decimals)
             if side == "SELL" and pnl != 0:
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"💰 *TP Filled!*\n\n"
                     f"📊 Side: `SELL`\n"
-                    f"💵 Price: `{Decimal(price):.4f}`\n"
-                    f"📦 Qty: `{Decimal(quantity or '0'):.2f}`\n"
+                    f"💵 Price: `{float(price):.4f}`\n"
+                    f"📦 Qty: `{float(quantity or 0):.2f}`\n"
                     f"🔢 Level: `{grid_level}`\n"
-                    f"💵 PnL: `{pnl:+.4f} USDT`\n"
-                    f"📈 Total Realized: `{self.state.realized_pnl:+.4f} USDT`{slippage_str}"
+                    f"💵 PnL: `{float(pnl):+.4f} USDT`\n"
+                    f"📈 Total Realized: `{float(self.state.realized_pnl):+.4f} USDT`{slippage_str}"
                 )
             elif is_partial:
                 # Partial fill notification (less verbose)
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"📦 *Partial Fill*\n\n"
                     f"📊 Side: `{side}`\n"
-                    f"💵 Price: `{Decimal(price):.4f}`\n"
-                    f"📦 Qty: `{Decimal(quantity or '0'):.2f}`\n"
+                    f"💵 Price: `{float(price):.4f}`\n"
+                    f"📦 Qty: `{float(quantity or 0):.2f}`\n"
                     f"🔢 Level: `{grid_level}`{slippage_str}"
                 )
             else:
@@ -2725,7 +3522,89 @@ class GridBot:
     # =========================================================================
     # MAIN BOT LOOP
     # =========================================================================
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """
+        Schedule a coroutine as a background task and keep a strong reference.
+
+        The task removes itself from the tracking set when it finishes, and
+        all still-running tasks are cancelled on shutdown.
+        """
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Sleep for up to `timeout` seconds, waking early on shutdown.
+
+        Returns:
+            True if shutdown was requested, False if the timeout elapsed
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _cancel_background_tasks(self) -> None:
+        """Cancel all tracked background tasks and wait for them to exit."""
+        tasks = list(self._bg_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._bg_tasks.clear()
     
+    async def _load_symbol_constraints(self) -> None:
+        """Fetch tick size, lot size and min notional for the symbol (defaults kept on failure)."""
+        try:
+            exchange_info = await self.client.get_exchange_info(self.symbol)
+            symbols = exchange_info.get("symbols", [])
+            
+            for sym_info in symbols:
+                if sym_info.get("symbol") == self.symbol:
+                    filters = sym_info.get("filters", [])
+                    for f in filters:
+                        if f.get("filterType") == "PRICE_FILTER":
+                            self.tick_size = Decimal(f.get("tickSize", "0.0001"))
+                        elif f.get("filterType") == "LOT_SIZE":
+                            self.lot_size = Decimal(f.get("stepSize", "0.01"))
+                        elif f.get("filterType") == "MIN_NOTIONAL":
+                            self.min_notional = Decimal(f.get("notional", "5"))
+                            self._min_notional_f = float(self.min_notional)
+                    break
+            
+            logger.info(f"Symbol constraints: tick={self.tick_size}, lot={self.lot_size}, minNotional={self.min_notional}")
+        except Exception as e:
+            logger.warning(f"Could not fetch exchange info, using defaults: {e}")
+
+    async def _apply_leverage(self) -> None:
+        """Set the configured leverage on the exchange."""
+        try:
+            await self.client.set_leverage(self.symbol, config.trading.LEVERAGE)
+            logger.info(f"Leverage set to {config.trading.LEVERAGE}x")
+        except AsterAPIError as e:
+            if "No need to change" not in str(e):
+                logger.warning(f"Could not set leverage: {e}")
+
+    async def _apply_margin_type(self) -> None:
+        """
+        Set the configured margin type on the exchange.
+
+        In Multi-Asset Mode margin type is locked to CROSSED; error -4168
+        indicates we're in Multi-Asset mode and can't change it.
+        """
+        try:
+            await self.client.set_margin_type(self.symbol, config.trading.MARGIN_TYPE)
+            logger.info(f"Margin type set to {config.trading.MARGIN_TYPE}")
+        except AsterAPIError as e:
+            if "No need to change" not in str(e) and "-4168" not in str(e):
+                logger.warning(f"Could not set margin type: {e}")
+            elif "-4168" in str(e):
+                logger.info("Multi-Asset Mode detected - margin type is managed by exchange")
+
     async def initialize(self) -> bool:
         """
         Initialize the bot before starting.
@@ -2743,7 +3622,7 @@ class GridBot:
         logger.info("=" * 60)
         logger.info("Aster DEX Grid Trading Bot - Initializing")
         logger.info("=" * 60)
-        logger.info(f"Symbol: {config.trading.SYMBOL}")
+        logger.info(f"Symbol: {self.symbol}")
         logger.info(f"Leverage: {config.trading.LEVERAGE}x")
         logger.info(f"Grid Count: {config.grid.GRID_COUNT}")
         logger.info(f"Grid Range: ±{config.grid.GRID_RANGE_PERCENT}%")
@@ -2761,51 +3640,23 @@ class GridBot:
             if not await self.client.test_connection():
                 logger.error("Failed to connect to API")
                 return False
+
+            # Align signed-request timestamps with the exchange clock once
+            await self.client.sync_server_time()
             
-            # Fetch exchange info for symbol constraints
-            try:
-                exchange_info = await self.client.get_exchange_info(config.trading.SYMBOL)
-                symbols = exchange_info.get("symbols", [])
-                
-                for sym_info in symbols:
-                    if sym_info.get("symbol") == config.trading.SYMBOL:
-                        filters = sym_info.get("filters", [])
-                        for f in filters:
-                            if f.get("filterType") == "PRICE_FILTER":
-                                self.tick_size = Decimal(f.get("tickSize", "0.0001"))
-                            elif f.get("filterType") == "LOT_SIZE":
-                                self.lot_size = Decimal(f.get("stepSize", "0.01"))
-                            elif f.get("filterType") == "MIN_NOTIONAL":
-                                self.min_notional = Decimal(f.get("notional", "5"))
-                        break
-                
-                logger.info(f"Symbol constraints: tick={self.tick_size}, lot={self.lot_size}, minNotional={self.min_notional}")
-            except Exception as e:
-                logger.warning(f"Could not fetch exchange info, using defaults: {e}")
-            
-            # Set leverage
-            try:
-                await self.client.set_leverage(config.trading.SYMBOL, config.trading.LEVERAGE)
-                logger.info(f"Leverage set to {config.trading.LEVERAGE}x")
-            except AsterAPIError as e:
-                if "No need to change" not in str(e):
-                    logger.warning(f"Could not set leverage: {e}")
-            
-            # Set margin type
-            # Note: In Multi-Asset Mode, margin type is locked to CROSSED
-            # Error -4168 indicates we're in Multi-Asset mode and can't change
-            try:
-                await self.client.set_margin_type(config.trading.SYMBOL, config.trading.MARGIN_TYPE)
-                logger.info(f"Margin type set to {config.trading.MARGIN_TYPE}")
-            except AsterAPIError as e:
-                if "No need to change" not in str(e) and "-4168" not in str(e):
-                    logger.warning(f"Could not set margin type: {e}")
-                elif "-4168" in str(e):
-                    logger.info("Multi-Asset Mode detected - margin type is managed by exchange")
-            
-            # Get current price first
-            ticker = await self.client.get_ticker_price()
-            current_price = Decimal(ticker.get("price", "0"))
+            # Symbol constraints, leverage, margin type and price are independent
+            # of each other, so fetch and apply them concurrently
+            results = await asyncio.gather(
+                self._load_symbol_constraints(),
+                self._apply_leverage(),
+                self._apply_margin_type(),
+                self._get_current_price(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            current_price = results[-1]
 
             if current_price <= 0:
                 logger.error("Failed to get current price")
@@ -2818,28 +3669,28 @@ class GridBot:
             # Gives accurate picture of available funds for new grid
             logger.info("Cancelling existing orders before placing new grid...")
             await self.cancel_all_orders()
-            await asyncio.sleep(2)  # Wait for orders to be cancelled and margin released
+            await self._wait_no_open_orders()  # Wait for orders to be cancelled
+            await asyncio.sleep(MARGIN_SETTLE_SECONDS)  # Let the exchange release their margin
 
             # Get initial balance AFTER cancelling orders (check both USDT and USDF for Multi-Asset Mode)
             # This ensures we see the actual available balance after margin is released
             logger.info("Querying actual balance after order cancellation...")
-            balances = await self.client.get_account_balance()
-            usdt_balance = Decimal("0")
-            usdf_balance = Decimal("0")
-
-            for balance in balances:
-                asset = balance.get("asset", "")
-                if asset == "USDT":
-                    usdt_balance = Decimal(balance.get("availableBalance", "0"))
-                elif asset == "USDF":
-                    usdf_balance = Decimal(balance.get("availableBalance", "0"))
+            # Positions are read alongside (for external close detection below)
+            balance_list, positions = await asyncio.gather(
+                self.client.get_account_balance(),
+                self.client.get_position_risk(self.symbol),
+            )
+            balances = {balance.get("asset", ""): balance for balance in balance_list}
+            usdt_balance = Decimal(balances.get("USDT", {}).get("availableBalance", "0"))
+            usdf_balance = Decimal(balances.get("USDF", {}).get("availableBalance", "0"))
 
-                # Set primary balance based on config
-                if asset == config.trading.MARGIN_ASSET:
-                    self.state.initial_balance = Decimal(balance.get("balance", "0"))
-                    self.state.current_balance = Decimal(balance.get("availableBalance", "0"))
+            # Set primary balance based on config
+            primary = balances.get(self.margin_asset)
+            if primary is not None:
+                self.state.initial_balance = Decimal(primary.get("balance", "0"))
+                self.state.current_balance = Decimal(primary.get("availableBalance", "0"))
 
-            logger.info(f"Initial balance: {self.state.initial_balance} {config.trading.MARGIN_ASSET}")
+            logger.info(f"Initial balance: {self.state.initial_balance} {self.margin_asset}")
 
             # USDF Recommendation Warning (for Airdrop optimization)
             if usdt_balance > Decimal("10") and usdf_balance < Decimal("10"):
@@ -2851,10 +3702,10 @@ class GridBot:
             # Initialize session tracking for Phase 3 risk management
             self.state.session_high_price = current_price
             self.state.daily_start_time = datetime.now()
-            self.state.daily_realized_pnl = Decimal("0")
+            self._daily_start_mono = time.monotonic()
+            self.state.daily_realized_pnl = _D0
 
             # Initialize position tracking for external close detection
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
             for pos in positions:
                 position_amt = Decimal(pos.get("positionAmt", "0"))
                 if position_amt != 0:
@@ -2871,12 +3722,14 @@ class GridBot:
             logger.info(f"Grid Range: ±{grid_range:.2f}% (Dynamic: {config.grid.DYNAMIC_GRID_SPACING_ENABLED})")
 
             # Calculate grid levels with dynamic range
-            self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+            self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
             
             # Log grid levels
-            logger.info("Grid Levels:")
-            for level in self.state.levels:
-                logger.info(f"  {level}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Grid Levels:\n  %s",
+                    "\n  ".join(repr(level) for level in self.state.levels),
+                )
 
             # Sync existing positions from exchange (place TP for positions from before restart)
             logger.info("Syncing existing positions from exchange...")
@@ -2888,30 +3741,30 @@ class GridBot:
             # Initialize trade logger and telegram
             await self.trade_logger.initialize()
             self._session_id = await self.trade_logger.start_session(
-                config.trading.SYMBOL, str(self.state.initial_balance)
+                self.symbol, str(self.state.initial_balance)
             )
             
             await self.telegram.start()
             await self.telegram_commands.start()
             await self.telegram.send_bot_started(
-                symbol=config.trading.SYMBOL,
+                symbol=self.symbol,
                 balance=self.state.initial_balance,
                 grid_count=config.grid.GRID_COUNT,
                 leverage=config.trading.LEVERAGE,
             )
             
             # Start Strategy Manager
-            asyncio.create_task(self.strategy_manager.start_monitoring())
+            self._spawn(self.strategy_manager.start_monitoring())
             
             # Start Daily Report Scheduler
-            asyncio.create_task(self._daily_report_scheduler())
+            self._spawn(self._daily_report_scheduler())
             
             # Start Auto Re-Grid Monitor
-            asyncio.create_task(self._auto_regrid_monitor())
+            self._spawn(self._auto_regrid_monitor())
 
             # Start Clear Signal Monitor (if waiting)
             if self._waiting_for_clear_signal:
-                asyncio.create_task(self._wait_for_clear_signal_monitor())
+                self._spawn(self._wait_for_clear_signal_monitor())
             
             return True
             
@@ -2934,23 +3787,47 @@ class GridBot:
                     logger.info("Reconnecting WebSocket in 5 seconds...")
                     await asyncio.sleep(5)
     
+    async def run_kline_stream(self) -> None:
+        """Keep the 1h candle cache current from the kline WebSocket stream."""
+        symbol = self.symbol
+        while not self._shutdown_event.is_set():
+            try:
+                # Seed history over REST, then follow the open candle live
+                candles = await self.client.get_klines(
+                    symbol=symbol, interval="1h", limit=KLINE_CACHE_SIZE
+                )
+                self._klines_cache.clear()
+                self._klines_cache.extend(candles)
+                await self.client.subscribe_market_data(
+                    symbol, ["kline_1h"], self.on_kline_update
+                )
+            except Exception as e:
+                logger.error(f"Kline stream error: {e}")
+            if not self._shutdown_event.is_set():
+                logger.info("Reconnecting kline stream in 5 seconds...")
+                await asyncio.sleep(5)
+
     async def run_monitoring_loop(self) -> None:
-        """Run periodic monitoring for circuit breaker and status."""
+        """Run periodic monitoring for circuit breaker and status (hourly summary runs separately)."""
         while not self._shutdown_event.is_set():
             try:
                 # Phase 3: Check if daily reset is needed (24 hours passed)
-                if self.state.daily_start_time:
-                    hours_elapsed = (datetime.now() - self.state.daily_start_time).total_seconds() / 3600
-                    if hours_elapsed >= 24:
+                if self._daily_start_mono is not None:
+                    if time.monotonic() - self._daily_start_mono >= DAILY_RESET_SECONDS:
                         old_daily_pnl = self.state.daily_realized_pnl
-                        self.state.daily_realized_pnl = Decimal("0")
+                        self.state.daily_realized_pnl = _D0
                         self.state.daily_start_time = datetime.now()
+                        self._daily_start_mono = time.monotonic()
                         logger.info(
                             f"📅 Daily PnL Reset: {old_daily_pnl:+.4f} USDT → 0 | "
                             f"New day started"
                         )
-                        # Resume if was paused due to daily loss limit
-                        if self.bot_state == BotState.PAUSED:
+                        # A daily-loss pause resumes only once the next
+                        # check confirms the loss is within limit again
+                        if self._breaker_state is BreakerState.OPEN:
+                            self._breaker_state = BreakerState.HALF_OPEN
+                            self._last_cb_inputs = None
+                        elif self.bot_state == BotState.PAUSED:
                             await self.resume()
 
                 # Check circuit breaker
@@ -2962,41 +3839,51 @@ class GridBot:
                 await self._update_trailing_tp_orders()
 
                 # Log status periodically with Phase 3 risk metrics
-                runtime = datetime.now() - self.state.start_time if self.state.start_time else None
-                logger.info(
-                    f"STATUS | Balance: {self.state.current_balance:.2f} | "
-                    f"uPnL: {self.state.unrealized_pnl:.4f} | "
-                    f"Drawdown: {self.state.drawdown_percent:.2f}% | "
-                    f"Daily: {self.state.daily_realized_pnl:+.4f} | "
-                    f"Positions: {self.state.positions_count}/{config.risk.MAX_POSITIONS} | "
-                    f"High: ${self.state.session_high_price:.2f} | "
-                    f"Trades: {self.state.total_trades} | "
-                    f"Runtime: {runtime}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    runtime = datetime.now() - self.state.start_time if self.state.start_time else None
+                    logger.info(
+                        f"STATUS | Balance: {_fmt(self.state.current_balance)} | "
+                        f"uPnL: {_fmt(self.state.unrealized_pnl, _Q4)} | "
+                        f"Drawdown: {_fmt(self.state.drawdown_percent)}% | "
+                        f"Daily: {self.state.daily_realized_pnl:+.4f} | "
+                        f"Positions: {self.state.positions_count}/{config.risk.MAX_POSITIONS} | "
+                        f"High: ${_fmt(self.state.session_high_price)} | "
+                        f"Trades: {self.state.total_trades} | "
+                        f"Runtime: {runtime}"
+                    )
                 
             except Exception as e:
                 logger.error(f"Monitoring error: {e}")
             
-            # Send hourly summary
-            if (datetime.now() - self._last_hourly_summary).total_seconds() >= 3600:
+            # Check every minute
+            if await self._wait_for_shutdown(60):
+                break
+    
+    async def _hourly_summary_loop(self) -> None:
+        """Send the hourly Telegram summary and resync the grid counters every hour."""
+        while not await self._wait_for_shutdown(HOURLY_SUMMARY_SECONDS):
+            try:
+                if not self.state.reconcile_counters():
+                    logger.warning("Grid state counters drifted from levels, resynced")
                 # Build market status from strategy manager
                 market_status = None
                 if self.strategy_manager.last_analysis:
                     analysis = self.strategy_manager.last_analysis
 
                     # Determine market regime and recommendation
-                    volume_ratio = getattr(analysis, 'volume_ratio', 0.0)
+                    volume_ratio = analysis.volume_ratio
                     trend_score = analysis.trend_score
-                    atr_percent = getattr(analysis, 'atr_percent', 0.0)
+                    atr_percent = analysis.atr_percent
+                    abs_trend = abs(trend_score)
 
                     # Market regime detection
                     if atr_percent > 5:
                         market_regime = "High Volatility"
                         recommendation = "Widen grid or pause"
-                    elif abs(trend_score) >= 3:
+                    elif abs_trend >= 3:
                         market_regime = "Strong Trend"
                         recommendation = "Follow trend"
-                    elif abs(trend_score) >= 2:
+                    elif abs_trend >= 2:
                         market_regime = "Trending"
                         recommendation = "Grid optimal"
                     elif volume_ratio < 0.5:
@@ -3014,10 +3901,10 @@ class GridBot:
 
                     market_status = {
                         "state": analysis.state.value,
-                        "trend_score": analysis.trend_score,
+                        "trend_score": trend_score,
                         "rsi": analysis.rsi,
                         "price": float(analysis.current_price),
-                        "current_side": config.grid.GRID_SIDE,
+                        "current_side": self.grid_side,
                         "volume_ratio": volume_ratio,
                         "atr_percent": atr_percent,
                         "market_regime": market_regime,
@@ -3035,10 +3922,9 @@ class GridBot:
                     active_orders=self.state.active_orders_count,
                     market_status=market_status,
                 )
-                self._last_hourly_summary = datetime.now()
-            
-            await asyncio.sleep(60)  # Check every minute
-    
+            except Exception as e:
+                logger.error(f"Failed to send hourly summary: {e}")
+
     async def _wait_for_clear_signal_monitor(self) -> None:
         """
         Monitor market until trend becomes clear, then start placing orders.
@@ -3054,13 +3940,11 @@ class GridBot:
 
         while self._waiting_for_clear_signal and not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(interval_seconds)
-
-                if self._shutdown_event.is_set():
+                if await self._wait_for_shutdown(interval_seconds):
                     break
 
                 # Re-analyze market
-                analysis = await self.strategy_manager.analyze_market(config.trading.SYMBOL)
+                analysis = await self.strategy_manager.analyze_market(self.symbol)
                 trend_score = self.strategy_manager.current_trend_score
 
                 if not trend_score:
@@ -3085,9 +3969,9 @@ class GridBot:
                 # Signal is clear! Start placing orders
                 logger.info(f"✅ Clear Signal Monitor: Signal clear! Setting grid to {optimal_side}")
                 self._waiting_for_clear_signal = False
-                config.grid.GRID_SIDE = optimal_side
+                self._set_grid_side(optimal_side)
 
-                await self.telegram.send_message(
+                self.telegram.queue_message(
                     f"✅ Clear Signal Detected!\n\n"
                     f"Trend Score: {trend_score.total:+d}\n"
                     f"Grid Side: {optimal_side}\n\n"
@@ -3095,15 +3979,14 @@ class GridBot:
                 )
 
                 # Recalculate grid with new side and place orders
-                ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-                current_price = Decimal(str(ticker.get("price", 0)))
+                current_price = await self._get_current_price()
 
                 # Calculate dynamic grid range
                 grid_range = await self.get_dynamic_grid_range(current_price)
 
                 # Recalculate grid levels
                 self.state.entry_price = current_price
-                self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+                self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
 
                 # Place orders
                 await self.place_grid_orders()
@@ -3135,13 +4018,14 @@ class GridBot:
             f"Auto Re-Grid Monitor started: checking every {config.grid.REGRID_CHECK_INTERVAL_MINUTES} min, "
             f"threshold {threshold}%"
         )
+
+        # Bind loop invariants once; none of these change while running
+        threshold_dec = Decimal(str(threshold))
         
         while not self._shutdown_event.is_set():
             try:
-                # Wait for interval
-                await asyncio.sleep(interval_seconds)
-                
-                if self._shutdown_event.is_set():
+                # Wait for interval (returns early on shutdown)
+                if await self._wait_for_shutdown(interval_seconds):
                     break
                 
                 # Calculate grid center
@@ -3150,9 +4034,8 @@ class GridBot:
                 
                 grid_center = (self.state.lower_price + self.state.upper_price) / 2
                 
-                # Get current price
-                ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-                current_price = Decimal(str(ticker.get("price", 0)))
+                # Get current price (streamed / cached from fills when fresh)
+                current_price = await self._get_current_price(PRICE_STALE_SECONDS)
                 
                 if current_price == 0:
                     continue
@@ -3161,21 +4044,25 @@ class GridBot:
                 drift = abs(current_price - grid_center) / grid_center * 100
                 
                 logger.info(
-                    f"Re-Grid Check: Price ${current_price:.2f} | "
-                    f"Grid Center ${grid_center:.2f} | Drift {drift:.2f}%"
+                    "Re-Grid Check: Price $%.2f | Grid Center $%.2f | Drift %.2f%%",
+                    current_price, grid_center, drift,
                 )
                 
-                if drift > Decimal(str(threshold)):
+                if drift > threshold_dec:
+                    price_str = _fmt(current_price)
+                    center_str = _fmt(grid_center)
+                    drift_str = _fmt(drift)
+
                     logger.warning(
-                        f"🔄 RE-GRID TRIGGERED: Drift {drift:.2f}% > {threshold}%"
+                        f"🔄 RE-GRID TRIGGERED: Drift {drift_str}% > {threshold}%"
                     )
                     
-                    # Send Telegram notification
-                    await self.telegram.send_message(
+                    # Send Telegram notification (queued, doesn't block the re-grid)
+                    self.telegram.queue_message(
                         f"🔄 Auto Re-Grid Triggered!\n"
-                        f"Price: ${current_price:.2f}\n"
-                        f"Grid Center: ${grid_center:.2f}\n"
-                        f"Drift: {drift:.2f}%"
+                        f"Price: ${price_str}\n"
+                        f"Grid Center: ${center_str}\n"
+                        f"Drift: {drift_str}%"
                     )
                     
                     # Cancel all orders
@@ -3186,7 +4073,7 @@ class GridBot:
 
                     # Recalculate grid centered on current price
                     self.state.entry_price = current_price
-                    self.state.levels = self.calculate_grid_levels(current_price, grid_range)
+                    self.state.replace_levels(self.calculate_grid_levels(current_price, grid_range))
 
                     # Place new orders
                     await self.place_grid_orders()
@@ -3194,15 +4081,19 @@ class GridBot:
                     # Re-place TPs for any existing positions (they were cancelled with grid orders)
                     await self.sync_existing_positions()
 
+                    lower_str = _fmt(self.state.lower_price)
+                    upper_str = _fmt(self.state.upper_price)
+                    range_str = _fmt(grid_range)
+
                     logger.info(
-                        f"✅ Re-Grid complete: New grid ${self.state.lower_price:.2f} - ${self.state.upper_price:.2f} "
-                        f"(Range: ±{grid_range:.2f}%)"
+                        f"✅ Re-Grid complete: New grid ${lower_str} - ${upper_str} "
+                        f"(Range: ±{range_str}%)"
                     )
 
-                    await self.telegram.send_message(
+                    self.telegram.queue_message(
                         f"✅ Re-Grid Complete!\n"
-                        f"New Grid: ${self.state.lower_price:.2f} - ${self.state.upper_price:.2f}\n"
-                        f"Range: ±{grid_range:.2f}%"
+                        f"New Grid: ${lower_str} - ${upper_str}\n"
+                        f"Range: ±{range_str}%"
                     )
                     
             except Exception as e:
@@ -3220,16 +4111,15 @@ class GridBot:
 
         Called from run_monitoring_loop.
         """
-        if not config.risk.USE_TRAILING_TP:
+        if not config.risk.USE_TRAILING_TP or not self.state.count_in_state(GridLevelState.TP_PLACED):
             return
 
         update_interval = config.risk.TRAILING_TP_UPDATE_INTERVAL
 
         # Find levels with TP orders that need updating
         levels_to_update = [
-            level for level in self.state.levels
-            if level.state == GridLevelState.TP_PLACED
-            and level.tp_order_id is not None
+            level for level in self.state.get_levels_in_state(GridLevelState.TP_PLACED)
+            if level.tp_order_id is not None
         ]
 
         if not levels_to_update:
@@ -3252,11 +4142,7 @@ class GridBot:
 
         try:
             # Fetch candles for SuperTrend calculation
-            candles = await self.client.get_klines(
-                symbol=config.trading.SYMBOL,
-                interval="1h",
-                limit=100
-            )
+            candles = await self._get_candles(100)
 
             if not candles:
                 logger.warning("No candle data for trailing TP update")
@@ -3274,14 +4160,13 @@ class GridBot:
                 return
 
             # Get current price for direction flip check
-            ticker = await self.client.get_ticker_price(config.trading.SYMBOL)
-            current_price = Decimal(ticker["price"])
+            current_price = await self._get_current_price()
 
             # Determine actual position side from exchange (not config)
-            positions = await self.client.get_position_risk(config.trading.SYMBOL)
-            position_side = "LONG" if config.grid.GRID_SIDE == "LONG" else "SHORT"  # fallback
+            positions = await self.client.get_position_risk(self.symbol)
+            position_side = "LONG" if self.grid_side == "LONG" else "SHORT"  # fallback
             for pos in positions:
-                if pos.get("symbol") == config.trading.SYMBOL:
+                if pos.get("symbol") == self.symbol:
                     pos_amt = Decimal(pos.get("positionAmt", "0"))
                     if pos_amt > 0:
                         position_side = "LONG"
@@ -3306,7 +4191,7 @@ class GridBot:
             if can_send_flip_alert:
                 try:
                     # Get trend analysis for context
-                    analysis = await self.indicator_analyzer.analyze(config.trading.SYMBOL)
+                    analysis = await self.indicator_analyzer.analyze(self.symbol)
                     if analysis and analysis.trend_score is not None:
                         trend_score = analysis.trend_score
                         volume_ratio = analysis.volume_ratio
@@ -3329,7 +4214,7 @@ class GridBot:
                         else:
                             suggestion = "💡 Mixed signals - use caution"
                 except Exception as e:
-                    logger.debug(f"Could not fetch market context: {e}")
+                    logger.debug("Could not fetch market context: %s", e)
 
             for level in levels_due_for_update:
                 try:
@@ -3355,7 +4240,7 @@ class GridBot:
                                 f"Reply `/close` to close all positions\n"
                                 f"_(Next alert in {cooldown_seconds // 60} min)_"
                             )
-                            await self.telegram.send_message(msg)
+                            self.telegram.queue_message(msg)
                             self.state.last_supertrend_flip_alert = now
                             can_send_flip_alert = False  # Only one alert per batch
                         level.last_tp_update = now
@@ -3382,7 +4267,7 @@ class GridBot:
                                 f"Reply `/close` to close all positions\n"
                                 f"_(Next alert in {cooldown_seconds // 60} min)_"
                             )
-                            await self.telegram.send_message(msg)
+                            self.telegram.queue_message(msg)
                             self.state.last_supertrend_flip_alert = now
                             can_send_flip_alert = False  # Only one alert per batch
                         level.last_tp_update = now
@@ -3422,16 +4307,16 @@ class GridBot:
                         # Cancel old order
                         if level.tp_order_id:
                             await self.client.cancel_order(
-                                symbol=config.trading.SYMBOL,
+                                symbol=self.symbol,
                                 order_id=level.tp_order_id
                             )
 
                         # Place new order at updated price
                         quantity = level.position_quantity
-                        client_order_id = f"tp_{level.index}_{int(now.timestamp())}"
+                        client_order_id = f"tp_{level.index}_{next(self._coid_counter)}"
 
                         response = await self.client.place_order(
-                            symbol=config.trading.SYMBOL,
+                            symbol=self.symbol,
                             side="SELL" if position_side == "LONG" else "BUY",
                             order_type="LIMIT",
                             quantity=quantity,
@@ -3440,15 +4325,15 @@ class GridBot:
                         )
 
                         # Update level state
-                        level.tp_order_id = response.get("orderId")
-                        level.order_id = level.tp_order_id
+                        level.set_tp_order_id(response.get("orderId"))
+                        level.set_order_id(level.tp_order_id)
                         level.tp_target_price = new_tp_price
                         level.supertrend_stop = new_stop
                         level.trailing_tp_active = True
                         level.client_order_id = client_order_id
 
                         tp_side = "SELL" if position_side == "LONG" else "BUY"
-                        await self.telegram.send_message(
+                        self.telegram.queue_message(
                             f"📈 Trailing TP Updated!\n"
                             f"Position: {position_side}\n"
                             f"Level: {level.index}\n"
@@ -3475,14 +4360,14 @@ class GridBot:
 
     async def _daily_report_scheduler(self) -> None:
         """
-        Send daily performance report every 24 hours.
+        Send daily performance report at startup, then every day at
+        DAILY_REPORT_HOUR local time.
         
         Report includes:
         - Total trades, PnL, ROI
         - Win rate, current balance
         - Runtime statistics
         """
-        # Wait 24 hours before first report (or until 8:00 AM)
         while not self._shutdown_event.is_set():
             try:
                 # Calculate stats
@@ -3490,20 +4375,20 @@ class GridBot:
                 runtime_hours = runtime.total_seconds() / 3600 if runtime else 0
                 
                 # Get win rate from trade logger
-                win_rate = Decimal("0")
+                win_rate = _D0
                 try:
                     trades = await self.trade_logger.get_recent_trades(100)
                     if trades:
                         profits = [float(t.get('pnl', 0) or 0) for t in trades]
                         wins = len([p for p in profits if p > 0])
                         total = len([p for p in profits if p != 0])
-                        win_rate = Decimal(str(wins / total * 100)) if total > 0 else Decimal("0")
+                        win_rate = Decimal(str(wins / total * 100)) if total > 0 else _D0
                 except Exception as e:
-                    logger.debug(f"Could not calculate win rate: {e}")
+                    logger.debug("Could not calculate win rate: %s", e)
                 
                 # Send daily report
                 await self.telegram.send_daily_report(
-                    symbol=config.trading.SYMBOL,
+                    symbol=self.symbol,
                     total_trades=self.state.total_trades,
                     realized_pnl=self.state.realized_pnl,
                     unrealized_pnl=self.state.unrealized_pnl,
@@ -3518,9 +4403,25 @@ class GridBot:
             except Exception as e:
                 logger.error(f"Failed to send daily report: {e}")
             
-            # Wait 24 hours
-            await asyncio.sleep(86400)  # 24 hours
+            # Wait until the next report hour (returns early on shutdown)
+            now = datetime.now()
+            next_report = now.replace(hour=DAILY_REPORT_HOUR, minute=0, second=0, microsecond=0)
+            if next_report <= now:
+                next_report += timedelta(days=1)
+            if await self._wait_for_shutdown((next_report - now).total_seconds()):
+                break
     
+    def _on_shutdown_signal(self) -> None:
+        """Signal handler: request graceful shutdown."""
+        logger.info("Shutdown signal received")
+        self._shutdown_event.set()
+
+    def _install_signal_handlers(self) -> None:
+        """Register SIGINT/SIGTERM handlers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._on_shutdown_signal)
+
     async def run(self) -> None:
         """
         Main entry point to run the bot.
@@ -3533,14 +4434,11 @@ class GridBot:
         5. Handles graceful shutdown
         """
         # Setup signal handlers for graceful shutdown
-        def signal_handler():
-            logger.info("Shutdown signal received")
-            self._shutdown_event.set()
-        
-        loop = asyncio.get_event_loop()
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, signal_handler)
+        self._install_signal_handlers()
         
+        # Write trade events from a background task for the whole run
+        self._spawn(trade_event_logger.run_writer())
+
         try:
             async with self.client:
                 # Initialize
@@ -3552,25 +4450,18 @@ class GridBot:
                 await self.place_grid_orders()
                 
                 # Start concurrent tasks
-                ws_task = asyncio.create_task(self.run_websocket_loop())
-                monitor_task = asyncio.create_task(self.run_monitoring_loop())
+                self._spawn(self._fill_worker())
+                self._spawn(self.run_websocket_loop())
+                self._spawn(self.run_monitoring_loop())
+                self._spawn(self._hourly_summary_loop())
+                if config.risk.USE_TRAILING_TP or config.risk.USE_SMART_TP:
+                    self._spawn(self.run_kline_stream())
                 
                 # Wait for shutdown
                 await self._shutdown_event.wait()
                 
-                # Cleanup
-                ws_task.cancel()
-                monitor_task.cancel()
-                
-                try:
-                    await ws_task
-                except asyncio.CancelledError:
-                    pass
-                
-                try:
-                    await monitor_task
-                except asyncio.CancelledError:
-                    pass
+                # Cleanup: cancel every background task and wait for them to finish
+                await self._cancel_background_tasks()
                 
         except Exception as e:
             logger.error(f"Fatal error: {e}")
@@ -3629,9 +4520,11 @@ def main():
             print(f"  ❌ {err}")
         sys.exit(1)
     
-    # Run bot
+    # Run bot (on uvloop when installed)
     bot = GridBot()
-    asyncio.run(bot.run())
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(bot.run())
 
 
 if __name__ == "__main__":
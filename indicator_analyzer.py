@@ -6,7 +6,7 @@ Technical analysis indicators for smart trading decisions.
 This module can use pre-calculated indicators from StrategyManager
 to avoid duplicate calculations and API calls.
 
-Uses 'ta' library for calculating RSI, MACD, ATR, and other indicators
+Uses 'ta' library for calculating RSI, MACD, and other indicators
 to determine optimal Take-Profit levels.
 
 Includes manual implementations of:
@@ -15,6 +15,7 @@ Includes manual implementations of:
 """
 
 import logging
+import math
 from decimal import Decimal
 from dataclasses import dataclass
 from typing import Optional, Literal, TYPE_CHECKING
@@ -23,7 +24,6 @@ import pandas as pd
 import numpy as np
 from ta.momentum import RSIIndicator
 from ta.trend import MACD, SMAIndicator
-from ta.volatility import AverageTrueRange
 
 if TYPE_CHECKING:
     from strategy_manager import MarketAnalysis
@@ -31,6 +31,83 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _wilder_atr(high: list[float], low: list[float], close: list[float], window: int) -> list[float]:
+    """
+    Average True Range with Wilder smoothing, matching ta's AverageTrueRange.
+
+    The first ATR is the mean true range of the first `window` bars; earlier
+    rows are 0. The first bar's true range is its high - low.
+    """
+    n = len(close)
+    true_range = [high[0] - low[0]]
+    for i in range(1, n):
+        prev_close = close[i-1]
+        true_range.append(max(
+            high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close)
+        ))
+
+    atr = [0.0] * n
+    if n < window:
+        return atr
+    atr[window-1] = float(np.mean(true_range[:window]))  # Same summation as ta/pandas
+    for i in range(window, n):
+        atr[i] = (atr[i-1] * (window - 1) + true_range[i]) / float(window)
+    return atr
+
+
+def _supertrend_recursion(
+    close: list[float],
+    basic_upper: list[float],
+    basic_lower: list[float],
+    start: int,
+) -> tuple[list[float], list[float], list[int], list[float]]:
+    """
+    SuperTrend final bands, direction and trend line from the basic bands.
+
+    Each bar depends on the previous one, so this is a sequential loop.
+    Rows before `start` keep the basic bands, direction 1 and a NaN trend line.
+
+    Returns:
+        (final_upper, final_lower, direction, supertrend)
+    """
+    n = len(close)
+    final_upper = list(basic_upper)
+    final_lower = list(basic_lower)
+    direction = [1] * n
+    supertrend = [float('nan')] * n
+
+    for i in range(start, n):
+        # Final upper band: lower of current basic_upper and previous final_upper
+        # (only if previous close was above previous final_upper)
+        if close[i-1] > final_upper[i-1]:
+            final_upper[i] = basic_upper[i]
+        else:
+            final_upper[i] = min(basic_upper[i], final_upper[i-1])
+
+        # Final lower band: higher of current basic_lower and previous final_lower
+        # (only if previous close was below previous final_lower)
+        if close[i-1] < final_lower[i-1]:
+            final_lower[i] = basic_lower[i]
+        else:
+            final_lower[i] = max(basic_lower[i], final_lower[i-1])
+
+        # Determine direction
+        if i == start:
+            # First calculation - use simple logic
+            direction[i] = 1 if close[i] > final_upper[i] else -1
+        elif direction[i-1] == 1:
+            # Was bullish: flip to bearish on close below the lower band
+            direction[i] = -1 if close[i] < final_lower[i] else 1
+        else:
+            # Was bearish: flip to bullish on close above the upper band
+            direction[i] = 1 if close[i] > final_upper[i] else -1
+
+        # Set SuperTrend value based on direction
+        supertrend[i] = final_lower[i] if direction[i] == 1 else final_upper[i]
+
+    return final_upper, final_lower, direction, supertrend
+
+
 @dataclass
 class MarketSignal:
     """Market analysis signal with recommended actions."""
@@ -154,7 +231,8 @@ class IndicatorAnalyzer:
         SuperTrend uses ATR to create dynamic support/resistance levels
         that trail the price during a trend.
 
-        Manual implementation using ta library for ATR calculation.
+        Runs on plain float lists: ATR (Wilder, as in ta) and the band
+        recursion are single sequential passes, so a DataFrame adds only overhead.
 
         Args:
             candles: List of candle dicts with OHLCV data
@@ -172,99 +250,36 @@ class IndicatorAnalyzer:
                 logger.warning(f"Not enough candles for SuperTrend: {len(candles)}")
                 return None
 
-            # Convert to DataFrame
-            df = self._candles_to_dataframe(candles)
-            if df is None:
-                return None
+            # Candle rows: [timestamp, open, high, low, close, volume, ...]
+            high = [float(c[2]) for c in candles]
+            low = [float(c[3]) for c in candles]
+            close = [float(c[4]) for c in candles]
 
-            # Calculate ATR using ta library
-            atr_indicator = AverageTrueRange(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=length
-            )
-            df['atr'] = atr_indicator.average_true_range()
-
-            # Calculate HL2 (midpoint of high and low)
-            df['hl2'] = (df['high'] + df['low']) / 2
-
-            # Calculate basic upper and lower bands
-            df['basic_upper'] = df['hl2'] + (multiplier * df['atr'])
-            df['basic_lower'] = df['hl2'] - (multiplier * df['atr'])
-
-            # Initialize SuperTrend columns
-            df['final_upper'] = df['basic_upper']
-            df['final_lower'] = df['basic_lower']
-            df['supertrend'] = np.nan
-            df['direction'] = 1  # 1 = bullish, -1 = bearish
-
-            # Calculate SuperTrend with proper logic
-            for i in range(length, len(df)):
-                # Final upper band: lower of current basic_upper and previous final_upper
-                # (only if previous close was above previous final_upper)
-                if df['close'].iloc[i-1] > df['final_upper'].iloc[i-1]:
-                    df.loc[df.index[i], 'final_upper'] = df['basic_upper'].iloc[i]
-                else:
-                    df.loc[df.index[i], 'final_upper'] = min(
-                        df['basic_upper'].iloc[i],
-                        df['final_upper'].iloc[i-1]
-                    )
-
-                # Final lower band: higher of current basic_lower and previous final_lower
-                # (only if previous close was below previous final_lower)
-                if df['close'].iloc[i-1] < df['final_lower'].iloc[i-1]:
-                    df.loc[df.index[i], 'final_lower'] = df['basic_lower'].iloc[i]
-                else:
-                    df.loc[df.index[i], 'final_lower'] = max(
-                        df['basic_lower'].iloc[i],
-                        df['final_lower'].iloc[i-1]
-                    )
-
-                # Determine direction
-                if i == length:
-                    # First calculation - use simple logic
-                    if df['close'].iloc[i] > df['final_upper'].iloc[i]:
-                        df.loc[df.index[i], 'direction'] = 1
-                    else:
-                        df.loc[df.index[i], 'direction'] = -1
-                else:
-                    prev_dir = df['direction'].iloc[i-1]
-                    prev_st = df['supertrend'].iloc[i-1]
-
-                    if prev_dir == 1:
-                        # Was bullish
-                        if df['close'].iloc[i] < df['final_lower'].iloc[i]:
-                            df.loc[df.index[i], 'direction'] = -1  # Flip to bearish
-                        else:
-                            df.loc[df.index[i], 'direction'] = 1  # Stay bullish
-                    else:
-                        # Was bearish
-                        if df['close'].iloc[i] > df['final_upper'].iloc[i]:
-                            df.loc[df.index[i], 'direction'] = 1  # Flip to bullish
-                        else:
-                            df.loc[df.index[i], 'direction'] = -1  # Stay bearish
-
-                # Set SuperTrend value based on direction
-                if df['direction'].iloc[i] == 1:
-                    df.loc[df.index[i], 'supertrend'] = df['final_lower'].iloc[i]
-                else:
-                    df.loc[df.index[i], 'supertrend'] = df['final_upper'].iloc[i]
+            atr = _wilder_atr(high, low, close, length)
 
-            # Get latest values
-            latest = df.iloc[-1]
+            # Basic bands around HL2 (midpoint of high and low)
+            basic_upper = []
+            basic_lower = []
+            for h, l, a in zip(high, low, atr):
+                hl2 = (h + l) / 2
+                basic_upper.append(hl2 + multiplier * a)
+                basic_lower.append(hl2 - multiplier * a)
+
+            final_upper, final_lower, direction, supertrend = _supertrend_recursion(
+                close, basic_upper, basic_lower, length,
+            )
 
             # Return None if critical SuperTrend values are NaN (insufficient data)
-            if pd.isna(latest['supertrend']) or pd.isna(latest['final_lower']) or pd.isna(latest['final_upper']):
+            if math.isnan(supertrend[-1]) or math.isnan(final_lower[-1]) or math.isnan(final_upper[-1]):
                 logger.warning("SuperTrend values contain NaN (insufficient data), returning None")
                 return None
 
             result = SuperTrendResult(
-                trend_line=float(latest['supertrend']),
-                direction=int(latest['direction']),
-                long_stop=float(latest['final_lower']),
-                short_stop=float(latest['final_upper']),
-                atr_value=float(latest['atr']) if pd.notna(latest['atr']) else 0.0
+                trend_line=supertrend[-1],
+                direction=direction[-1],  # 1 = bullish, -1 = bearish
+                long_stop=final_lower[-1],
+                short_stop=final_upper[-1],
+                atr_value=atr[-1] if not math.isnan(atr[-1]) else 0.0
             )
 
             logger.debug(
@@ -64,6 +64,7 @@ class MarketAnalysis:
     sma_20: float = 0.0
     sma_50: float = 0.0
     volume_ratio: float = 1.0  # Current volume / avg volume
+    atr_percent: float = 0.0  # ATR as % of current price
 
 
 @dataclass
@@ -1716,6 +1717,7 @@ class StrategyManager:
                 sma_20=sma_20,
                 sma_50=sma_50,
                 volume_ratio=volume_ratio,
+                atr_percent=float(atr / current_price * 100) if current_price > 0 else 0.0,
             )
             
             self.last_analysis = analysis
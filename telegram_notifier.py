@@ -41,6 +41,9 @@ class TelegramConfig:
     """Telegram notification settings."""
     BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
     CHAT_ID: str = os.getenv("TELEGRAM_CHAT_ID", "")
+    # How long the sender waits after a message arrives so a burst
+    # (e.g. several fills) goes out as one message (milliseconds)
+    FLUSH_MS: int = int(os.getenv("TELEGRAM_FLUSH_MS", "500"))
     
     # Notification toggles
     NOTIFY_ORDERS: bool = True
@@ -68,6 +71,15 @@ class TelegramNotifier:
     """
     
     API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+
+    # Telegram allows about one message per second into a single chat
+    MIN_SEND_INTERVAL = 1.0
+    # Telegram's text limit; a queued backlog is merged up to this size
+    MAX_MESSAGE_LENGTH = 4096
+    # Attempts per message when Telegram answers 429 with retry_after
+    MAX_SEND_ATTEMPTS = 3
+    # How long stop() waits for queued messages to go out
+    STOP_FLUSH_TIMEOUT = 5.0
     
     def __init__(self, config: TelegramConfig | None = None):
         """
@@ -103,6 +115,13 @@ class TelegramNotifier:
     async def stop(self) -> None:
         """Stop the notifier and close connections."""
         if self._worker_task:
+            # Let queued alerts (e.g. a circuit breaker trip) go out first
+            try:
+                await asyncio.wait_for(self._message_queue.join(), self.STOP_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Telegram stopping with {self._message_queue.qsize()} message(s) unsent"
+                )
             self._worker_task.cancel()
             try:
                 await self._worker_task
@@ -116,20 +135,74 @@ class TelegramNotifier:
         logger.info("Telegram notifier stopped")
     
     async def _message_worker(self) -> None:
-        """Background worker to send queued messages."""
+        """
+        Background worker to send queued messages.
+
+        Sends at most one message per MIN_SEND_INTERVAL. A new message is
+        held for FLUSH_MS first, and when messages pile up (e.g. a burst of
+        fills) everything queued is merged into as few sends as
+        MAX_MESSAGE_LENGTH allows instead of being sent one by one into
+        Telegram's rate limit. If Telegram rejects a merged message, its
+        parts are resent one by one (see _send_parts).
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._message_queue
+        flush_delay = self.config.FLUSH_MS / 1000
+        carry: str | None = None  # Dequeued but didn't fit the previous send
         while True:
             try:
-                message = await self._message_queue.get()
-                await self._send_message(message)
-                
-                # Rate limiting - max 30 messages per second (Telegram limit)
-                await asyncio.sleep(0.05)
-                
+                if carry is None:
+                    carry = await queue.get()
+                    if flush_delay > 0:
+                        await asyncio.sleep(flush_delay)
+                parts = [carry]
+                size = len(carry)
+                carry = None
+                while not queue.empty():
+                    message = queue.get_nowait()
+                    if size + 2 + len(message) > self.MAX_MESSAGE_LENGTH:
+                        carry = message
+                        break
+                    parts.append(message)
+                    size += 2 + len(message)
+
+                started = loop.time()
+                try:
+                    await self._send_parts(parts)
+                finally:
+                    for _ in parts:
+                        queue.task_done()
+
+                await asyncio.sleep(self.MIN_SEND_INTERVAL - (loop.time() - started))
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in message worker: {e}")
     
+    async def _send_parts(self, parts: list[str]) -> None:
+        """
+        Send queued messages merged into one.
+
+        A rejected merge (usually one message's unbalanced Markdown, e.g. an
+        error text with an underscore) must not drop the others, so each
+        part is then resent alone, and a part still rejected goes out as
+        plain text. Timeouts and exhausted 429 retries are not resent.
+        """
+        if not self._session or not self.config.is_configured:
+            return
+        status = await self._post_message("\n\n".join(parts), "Markdown")
+        if status < 400 or status == 429:
+            return
+        for part in parts:
+            if len(parts) > 1:
+                await asyncio.sleep(self.MIN_SEND_INTERVAL)
+                status = await self._post_message(part, "Markdown")
+                if status < 400 or status == 429:
+                    continue
+            await asyncio.sleep(self.MIN_SEND_INTERVAL)
+            await self._post_message(part, None)
+
     async def _send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
         """
         Send message to Telegram.
@@ -143,31 +216,53 @@ class TelegramNotifier:
         """
         if not self._session or not self.config.is_configured:
             return False
-        
+        return await self._post_message(text, parse_mode) == 200
+
+    async def _post_message(self, text: str, parse_mode: str | None) -> int:
+        """
+        POST one sendMessage, retrying while Telegram answers 429.
+
+        Args:
+            text: Message text
+            parse_mode: Telegram parse mode, or None for plain text
+
+        Returns:
+            Final HTTP status (0 if the request itself failed)
+        """
         url = self.API_URL.format(token=self.config.BOT_TOKEN)
         
         payload = {
             "chat_id": self.config.CHAT_ID,
             "text": text,
-            "parse_mode": parse_mode,
             "disable_web_page_preview": True,
         }
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
         
-        try:
-            async with self._session.post(url, json=payload, timeout=10) as resp:
-                if resp.status == 200:
-                    return True
-                else:
-                    error = await resp.text()
-                    logger.error(f"Telegram API error: {resp.status} - {error}")
-                    return False
-                    
-        except asyncio.TimeoutError:
-            logger.error("Telegram API timeout")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}")
-            return False
+        for attempt in range(1, self.MAX_SEND_ATTEMPTS + 1):
+            try:
+                async with self._session.post(url, json=payload, timeout=10) as resp:
+                    if resp.status == 200:
+                        return 200
+                    if resp.status != 429 or attempt == self.MAX_SEND_ATTEMPTS:
+                        error = await resp.text()
+                        logger.error(f"Telegram API error: {resp.status} - {error}")
+                        return resp.status
+                    # Rate limited - Telegram says how long to back off
+                    data = await resp.json(content_type=None)
+                    retry_after = data.get("parameters", {}).get("retry_after", 1)
+
+            except asyncio.TimeoutError:
+                logger.error("Telegram API timeout")
+                return 0
+            except Exception as e:
+                logger.error(f"Failed to send Telegram message: {e}")
+                return 0
+
+            logger.warning(f"Telegram rate limited, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+
+        return 429
     
     def queue_message(self, text: str) -> None:
         """Queue a message for sending (non-blocking)."""
@@ -79,6 +79,52 @@ class TestGridCalculation:
             assert actual_side == expected_side, f"Price {price}: expected {expected_side}, got {actual_side}"
 
 
+    def test_tick_count_grid_matches_quantize(self):
+        """Tick-count grid prices match per-level quantize rounding."""
+        from decimal import ROUND_DOWN
+        from grid_bot import _grid_prices
+
+        tick_size = Decimal("0.0001")
+        lower = Decimal("0.9683") * Decimal("0.95")
+        upper = Decimal("0.9683") * Decimal("1.05")
+        count = 7
+        step = (upper - lower) / (count - 1)
+
+        expected = [
+            ((lower + Decimal(i) * step) / tick_size).quantize(Decimal("1"), ROUND_DOWN) * tick_size
+            for i in range(count)
+        ]
+        assert list(_grid_prices(lower, step, count, tick_size)) == expected
+
+    def test_centered_grid_multipliers(self):
+        """Centered grid prices from calculate_grid_levels match lower + i * step."""
+        from decimal import ROUND_DOWN
+        from config import config
+        from grid_bot import GridBot
+
+        tick_size = Decimal("0.0001")
+        center = Decimal("0.9683")
+        range_pct = Decimal("0.05")
+        count = 7
+        lower = center * (1 - range_pct)
+        step = (center * (1 + range_pct) - lower) / (count - 1)
+
+        bot = GridBot()
+        bot.tick_size = tick_size
+        with patch.object(config.grid, "GRID_COUNT", count), \
+                patch.object(config.grid, "LOWER_PRICE", None), \
+                patch.object(config.grid, "UPPER_PRICE", None):
+            levels = bot.calculate_grid_levels(center, range_pct * 100)
+
+        expected = [
+            ((lower + Decimal(i) * step) / tick_size).quantize(Decimal("1"), ROUND_DOWN) * tick_size
+            for i in range(count)
+        ]
+        prices = [level.price for level in levels]
+        assert prices == expected
+        assert prices[3] == center
+
+
 class TestPriceRounding:
     """Test price and quantity rounding to valid exchange values."""
     
@@ -114,6 +160,18 @@ class TestPriceRounding:
             rounded = (input_qty / lot_size).quantize(Decimal("1"), ROUND_DOWN) * lot_size
             assert rounded == expected, f"Input {input_qty}: expected {expected}, got {rounded}"
 
+    def test_tp_price_in_ticks(self):
+        """Tick-scaled TP price matches percent math followed by tick rounding."""
+        from grid_bot import _tp_price_ticks
+
+        tick_size = Decimal("0.0001")
+        entry_price = Decimal("0.96834567")
+
+        for tp_percent in (Decimal("1.5"), Decimal("-1.5"), Decimal("0.35")):
+            expected = (entry_price * (1 + tp_percent / 100)) // tick_size * tick_size
+            assert _tp_price_ticks(entry_price, tp_percent, tick_size) == expected
+        assert _tp_price_ticks(entry_price, Decimal("1.5"), tick_size) == Decimal("0.9828")
+
 
 class TestQuantityCalculation:
     """Test order quantity calculation."""
@@ -176,6 +234,63 @@ class TestDrawdownCalculation:
         
         assert expected_drawdown == Decimal("14")
 
+    def test_risk_limits_match_percent_checks(self):
+        """USDT limits trip exactly where the percent checks do."""
+        from grid_bot import _risk_limits
+
+        equity_floor, daily_loss_cap = _risk_limits(Decimal("500"), Decimal("14"), Decimal("10"))
+
+        assert equity_floor == Decimal("430")  # 14% drawdown, as above
+        assert daily_loss_cap == Decimal("50")
+        assert _risk_limits(Decimal("0"), Decimal("14"), Decimal("10")) is None
+
+
+class TestGridStateCounters:
+    """Test incrementally maintained GridState counters."""
+
+    def test_counters_follow_level_transitions(self):
+        """Counters match a full scan after fills, resets and a regrid."""
+        from grid_bot import GridState, GridLevel, GridLevelState
+
+        state = GridState(levels=[GridLevel(index=i, price=Decimal(i + 1)) for i in range(4)])
+        state.levels[0].set_order_id(11)
+        state.levels[1].set_order_id(12)
+        state.levels[1].add_partial_fill(Decimal("2"), Decimal("3"))
+        state.levels[1].add_partial_fill(Decimal("2.1"), Decimal("1"))
+        state.levels[2].set_state(GridLevelState.TP_PLACED)
+
+        assert state.active_orders_count == 2
+        assert state.positions_count == 2
+        assert state.get_total_position_quantity() == Decimal("4")
+        assert state.get_levels_in_state(GridLevelState.EMPTY) == [state.levels[0], state.levels[3]]
+        assert state.count_in_state(GridLevelState.TP_PLACED) == 1
+        assert state.get_levels_with_position() == [state.levels[1], state.levels[2]]
+
+        # TP placement mirrors the TP id into order_id; the index follows both
+        state.levels[2].set_tp_order_id(21)
+        state.levels[2].set_order_id(21)
+        assert state.get_level_by_order_id(12) is state.levels[1]
+        assert state.get_level_by_tp_order_id(21) is state.levels[2]
+        state.levels[2].set_order_id(None)
+        assert state.get_level_by_order_id(21) is state.levels[2]
+        state.levels[2].set_tp_order_id(None)
+        assert state.get_level_by_order_id(21) is None
+
+        state.levels[1].reset()
+        assert state.get_level_by_order_id(12) is None
+        assert (state.active_orders_count, state.positions_count) == (1, 1)
+        assert state.get_total_position_quantity() == Decimal("0")
+        assert state.get_levels_in_state(GridLevelState.POSITION_HELD) == []
+        assert state.count_in_state(GridLevelState.EMPTY, GridLevelState.POSITION_HELD) == 3
+        assert state.reconcile_counters()
+
+        old_level = state.levels[0]
+        state.replace_levels([GridLevel(index=0, price=Decimal("1"))])
+        old_level.set_state(GridLevelState.POSITION_HELD)
+        assert (state.active_orders_count, state.positions_count) == (0, 0)
+        assert state.get_level_by_order_id(11) is None
+        assert state.reconcile_counters()
+
 
 class TestHMACSignature:
     """Test HMAC-SHA256 signature generation."""
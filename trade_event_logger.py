@@ -9,8 +9,12 @@ Each log entry contains:
 - Relevant data (price, quantity, indicators, etc.)
 
 Log format: JSONL (one JSON object per line)
+
+While run_writer() is running, events are queued and written in batches
+off the event loop; otherwise they are written immediately.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -39,10 +43,25 @@ class TradeEventLogger:
     This makes it easy to process with tools like jq, pandas, etc.
     """
     
+    # Bound on queued events; beyond it new events are dropped and counted
+    MAX_QUEUED_EVENTS = 10_000
+    # A warning is logged for the first dropped event and every this many after
+    DROP_WARN_EVERY = 1000
+    # Events written per file open by the background writer
+    WRITE_BATCH_SIZE = 256
+
     def __init__(self, log_file: Optional[str] = None):
         self.log_file = log_file or config.log.TRADE_EVENTS_LOG
+        self._queue: Optional[asyncio.Queue] = None
+        # Events dropped because the background writer fell behind
+        self.dropped_events = 0
         self._ensure_log_dir()
     
+    @property
+    def enabled(self) -> bool:
+        """Whether events are written anywhere (callers can skip building them)."""
+        return bool(self.log_file)
+
     def _ensure_log_dir(self):
         """Ensure log directory exists."""
         if self.log_file:
@@ -72,11 +91,64 @@ class TradeEventLogger:
             **data
         }
         
+        queue = self._queue
+        if queue is not None:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Writing here would race the executor's append to the same file
+                if self.dropped_events % self.DROP_WARN_EVERY == 0:
+                    logger.warning(
+                        f"Trade event writer is behind, dropping events "
+                        f"({self.dropped_events + 1} dropped so far)"
+                    )
+                self.dropped_events += 1
+            return
+
+        self._write_events([event])
+
+    def _write_events(self, events: list[dict[str, Any]]) -> None:
+        """Serialize events and append them to the log file in one write."""
         try:
+            lines = "".join(json.dumps(event, cls=DecimalEncoder) + "\n" for event in events)
             with open(self.log_file, "a") as f:
-                f.write(json.dumps(event, cls=DecimalEncoder) + "\n")
+                f.write(lines)
         except Exception as e:
             logger.error(f"Failed to write trade event: {e}")
+
+    async def run_writer(self) -> None:
+        """
+        Write queued events in batches until cancelled.
+
+        Serialization and file I/O run in the default executor, so logging
+        from the trading path costs only a queue put. Events still queued
+        when the writer is cancelled are flushed before it exits.
+        """
+        if not self.log_file:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUED_EVENTS)
+        self._queue = queue
+        loop = asyncio.get_running_loop()
+        write: Optional[asyncio.Future] = None
+        try:
+            while True:
+                events = [await queue.get()]
+                while len(events) < self.WRITE_BATCH_SIZE and not queue.empty():
+                    events.append(queue.get_nowait())
+                write = loop.run_in_executor(None, self._write_events, events)
+                await asyncio.shield(write)
+        finally:
+            # Let an in-flight batch land first so the file stays in order;
+            # events logged meanwhile still go to the queue, not the file
+            if write is not None and not write.done():
+                await write
+            self._queue = None
+            remaining = []
+            while not queue.empty():
+                remaining.append(queue.get_nowait())
+            if remaining:
+                self._write_events(remaining)
     
     # Convenience methods for common events
     
@@ -91,6 +91,10 @@ class TradeLogger:
                 timeout=30.0
             )
             self._connection.row_factory = sqlite3.Row
+            # WAL lets report reads run alongside trade inserts without
+            # blocking on the writer lock
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
         return self._connection
     
     def _create_tables(self) -> None: